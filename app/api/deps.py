@@ -1,6 +1,12 @@
+import hashlib
+import hmac
+import threading
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, defer
 from jose import JWTError, jwt
 
 from app.db.postgres import get_db
@@ -10,40 +16,93 @@ from cachetools import TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# 디코딩 전 토큰 길이 상한 (비정상적으로 큰 토큰으로 인한 CPU/메모리 낭비 방지)
+MAX_TOKEN_LENGTH = 4096
+
 # 사용자 정보 캐시 (TTL 5분, 최대 1024개)
-# Key: (username, token_version)
+# Key: "username\0token_version"의 BLAKE2b-128 해시
 user_cache = TTLCache(maxsize=1024, ttl=300)
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    credentials_error = HTTPException(
+# 같은 사용자에 대한 동시 캐시 미스를 하나의 DB 조회로 합치기 위한 스트라이프 락
+# (캐시 키 첫 바이트로 락 선택, 락 개수는 고정)
+_USER_LOCK_STRIPES = 64
+_user_locks = [threading.Lock() for _ in range(_USER_LOCK_STRIPES)]
+
+# JWT 검증 결과 캐시 (TTL 60초, 최대 4096개)
+# Key: 토큰 원문의 BLAKE2b-128 해시, Value: 검증된 payload
+token_cache = TTLCache(maxsize=4096, ttl=60)
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _user_cache_key(username: str, token_ver) -> bytes:
+    return hashlib.blake2b(f"{username}\0{token_ver}".encode(), digest_size=16).digest()
+
+
+def _decode_token(token: str) -> dict:
+    """
+    JWT를 검증하고 payload를 반환.
+    같은 토큰의 반복 검증(HMAC + base64 + JSON)을 피하기 위해 결과를 캐시함.
+    만료 시각이 지난 캐시 항목은 사용하지 않음.
+    """
+    if len(token) > MAX_TOKEN_LENGTH:
+        raise JWTError("Token too large")
+
+    key = _token_cache_key(token)
+    cached = token_cache.get(key)
+    if cached is not None:
+        exp = cached.get("exp")
+        if exp is None or exp > time.time():
+            return cached
+        token_cache.pop(key, None)
+
+    payload = jwt.decode(
+        token,
+        settings.secret_key,
+        algorithms=[settings.jwt_algorithm],
+        options={"require_exp": True, "require_sub": True},
+    )
+    if payload.get("sub") is not None:
+        token_cache[key] = payload
+    return payload
+
+
+def _credentials_error() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
-        username: str | None = payload.get("sub")   # sub은 username
-        token_ver = payload.get("ver", 0)           # 토큰 버전(없으면 0으로 간주)
-        if username is None:
-            raise credentials_error
-    except JWTError:
-        raise credentials_error
 
-    # 1. 캐시 확인
-    cache_key = (username, token_ver)
-    if cache_key in user_cache:
-        return user_cache[cache_key]
 
-    # 2. DB 조회
-    user = db.query(User).filter(User.username == username).first()
+def _versions_match(token_ver, current_ver) -> bool:
+    # 타이밍 차이로 정보가 새지 않도록 상수 시간 비교
+    return hmac.compare_digest(
+        str(int(token_ver or 0)).encode(),
+        str(int(current_ver or 0)).encode(),
+    )
+
+
+def _load_user(
+    db: Session,
+    cache_key: bytes,
+    username: str,
+    token_ver,
+    credentials_error: HTTPException,
+) -> User:
+    # 2. DB 조회 (users.username 유니크 인덱스 사용, 인증에 불필요한 hashed_password는 제외)
+    user = db.execute(
+        select(User)
+        .options(defer(User.hashed_password))
+        .where(User.username == username)
+    ).scalar_one_or_none()
     if not user:
         raise credentials_error
 
     # 토큰 버전 불일치 시(로그아웃 이후의 오래된 토큰) 인증 실패
-    if int(token_ver) != int(getattr(user, "token_version", 0)):
+    if not _versions_match(token_ver, getattr(user, "token_version", 0)):
         raise credentials_error
 
     # 3. 캐시 저장 (세션에서 분리하여 저장)
@@ -52,4 +111,37 @@ def get_current_user(
     db.expunge(user)
     user_cache[cache_key] = user
 
-    return user
\ No newline at end of file
+    return user
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    credentials_error = _credentials_error()
+    try:
+        payload = _decode_token(token)
+    except JWTError:
+        raise credentials_error
+    username: str | None = payload.get("sub")   # sub은 username
+    token_ver = payload.get("ver", 0)           # 토큰 버전(없으면 0으로 간주)
+    if username is None:
+        raise credentials_error
+
+    # 1. 캐시 확인
+    cache_key = _user_cache_key(username, token_ver)
+    cached_user = user_cache.get(cache_key)
+    if cached_user is not None:
+        return cached_user
+
+    with _user_locks[cache_key[0] % _USER_LOCK_STRIPES]:
+        # 락 대기 중 다른 요청이 캐시를 채웠으면 재사용
+        cached_user = user_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+        return _load_user(db, cache_key, username, token_ver, credentials_error)
+
+
+def invalidate_user_caches(username: str, token_version: int) -> None:
+    """로그아웃/탈퇴로 기존 토큰이 무효가 될 때 로컬 캐시 정리"""
+    user_cache.pop(_user_cache_key(username, token_version), None)
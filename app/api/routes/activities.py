@@ -5,19 +5,23 @@
 from fastapi import APIRouter, Query, Depends
 from pymongo.database import Database
 
-from app.db.mongodb import get_mongo_db
-from app.schemas.activity import UserActivityListResponse, UserActivityOut
-from app.utils.mongodb import serialize_object_id
+from app.core.settings import settings
+from app.db.mongodb import get_mongo_db, ACTIVITIES_FILTER_INDEX
+from app.schemas.activity import UserActivityListResponse
+from app.utils.mongodb import MongoJSONResponse, cursor_filter, encode_cursor
 
 router = APIRouter(prefix="/activities", tags=["activities"])
 
 
-@router.get("", response_model=UserActivityListResponse)
+# 응답 검증/재직렬화를 생략하고 orjson으로 바로 응답 (스키마는 문서화용으로만 사용)
+@router.get("", response_model=None, responses={200: {"model": UserActivityListResponse}})
 def get_activities(
     user_id: int | None = Query(None, description="사용자 ID로 필터링"),
     activity_type: str | None = Query(None, description="활동 타입으로 필터링 (view, bookmark, search 등)"),
     paper_id: str | None = Query(None, description="논문 ID로 필터링"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 기록 수"),
+    include_total: bool = Query(False, description="전체 개수(total) 포함 여부"),
+    cursor: str | None = Query(None, description="이전 페이지의 next_cursor (이 기록 이후의 더 오래된 기록만 조회)"),
     db: Database = Depends(get_mongo_db),
 ):
     """
@@ -31,6 +35,8 @@ def get_activities(
         activity_type: 특정 활동 타입만 조회 (view, bookmark, search 등)
         paper_id: 특정 논문에 대한 활동만 조회
         limit: 조회할 기록 수 (기본 100, 최대 1000)
+        include_total: True일 때만 count_documents로 전체 개수 계산 (기본 False)
+        cursor: 다음 페이지 조회용 커서 (응답의 next_cursor 값, skip 없이 (timestamp, _id) 범위로 조회)
         db: MongoDB Database
     
     Returns:
@@ -40,6 +46,8 @@ def get_activities(
         GET /activities?user_id=123&limit=20
         GET /activities?activity_type=view&limit=50
         GET /activities?paper_id=507f1f77bcf86cd799439011
+        GET /activities?user_id=123&include_total=true
+        GET /activities?user_id=123&cursor=2025-01-01T12:00:00_507f1f77bcf86cd799439011
     """
     collection = db["user_activities"]
     
@@ -54,23 +62,44 @@ def get_activities(
             query["paper_id"] = safe_object_id(paper_id, "paper ID")
         except:
             # 유효하지 않은 paper_id면 빈 결과 반환
-            return UserActivityListResponse(total=0, items=[])
+            return MongoJSONResponse({"total": 0 if include_total else None, "items": [], "next_cursor": None})
     
-    total = collection.count_documents(query)
+    # 전체 개수는 요청한 경우에만 계산 (매칭 문서 전체 스캔 비용 회피)
+    total = collection.count_documents(query) if include_total else None
     
-    cursor = collection.find(query).sort("timestamp", -1).limit(limit)
+    # 세 필터가 모두 있으면 복합 인덱스를 명시해 정렬까지 인덱스로 처리
+    hint = ACTIVITIES_FILTER_INDEX if len(query) == 3 else None
     
-    items = []
-    for doc in cursor:
-        serialize_object_id(doc)
-        doc["id"] = doc.pop("_id")
-        if "paper_id" in doc:
-            doc["paper_id"] = str(doc["paper_id"])
-        
-        # metadata가 없으면 None으로 설정
-        if "metadata" not in doc:
-            doc["metadata"] = None
-        
-        items.append(UserActivityOut(**doc))
+    # 커서 기반 페이지네이션: 인덱스 범위 조회로 깊은 페이지도 일정 비용
+    # 같은 시각에 기록된 활동(백그라운드 일괄 기록)이 경계에서 빠지지 않도록 _id까지 비교
+    if cursor is not None:
+        query.update(cursor_filter(cursor, "timestamp"))
     
-    return UserActivityListResponse(total=total, items=items)
+    # ObjectId → 문자열 변환과 누락 필드 기본값 처리를 Mongo 쪽에서 수행
+    pipeline = [
+        {"$match": query},
+        {"$sort": {"timestamp": -1, "_id": -1}},
+        {"$limit": limit},
+        {"$project": {
+            "_id": 0,
+            "id": {"$toString": "$_id"},
+            "user_id": 1,
+            "paper_id": {"$toString": "$paper_id"},
+            "activity_type": 1,
+            "metadata": {"$ifNull": ["$metadata", None]},
+            "timestamp": 1,
+        }},
+    ]
+    options = {"batchSize": min(limit, 500)}
+    if hint:
+        options["hint"] = hint
+    
+    # 서버가 기록한 문서를 위 $project로 정형화했으므로 모델 생성 없이 그대로 응답
+    items = list(collection.aggregate(pipeline, **options))
+    
+    next_cursor = encode_cursor(items[-1]["timestamp"], items[-1]["id"]) if len(items) == limit else None
+    result = {"total": total, "items": items, "next_cursor": next_cursor}
+    if settings.app_env == "local":
+        # 개발 환경에서만 응답 스키마 일치 여부 확인 (운영에서는 검증 비용 생략)
+        UserActivityListResponse.model_validate(result)
+    return MongoJSONResponse(result)
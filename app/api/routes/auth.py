@@ -1,26 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from datetime import timedelta
+from sqlalchemy import select, literal
+from sqlalchemy.exc import IntegrityError
 
 from app.db.postgres import get_db
 from app.models.user import User
 from app.schemas.auth import UserCreate, UserOut, Token, UsernameExists
-from app.core.security import get_password_hash, verify_password, create_access_token
-from app.core.settings import settings
-from app.api.deps import get_current_user
+from app.core.security import get_password_hash, verify_and_update_password, create_access_token
+from app.api.deps import get_current_user, invalidate_user_caches
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED)
 def register(payload: UserCreate, db: Session = Depends(get_db)):
-    exists = db.query(User).filter(
-        or_(User.email == payload.email, User.username == payload.username)
-    ).first()
-    if exists:
-        raise HTTPException(status_code=400, detail="Email or username already registered")
     user = User(
         email=payload.email,
         username=payload.username,
@@ -28,23 +22,36 @@ def register(payload: UserCreate, db: Session = Depends(get_db)):
         hashed_password=get_password_hash(payload.password),
     )
     db.add(user)
+    # email/username 중복은 유니크 제약으로 INSERT 시점에 검출 (사전 SELECT 생략)
+    # eager_defaults로 flush 시 RETURNING으로 id/created_at이 채워지므로 refresh 불필요
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Email or username already registered")
+    out = UserOut.model_validate(user)
     db.commit()
-    db.refresh(user)
-    return user
+    return out
 
 
 @router.post("/login", response_model=Token)
 def login(form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     user = db.query(User).filter(User.username == form.username).first()
-    if not user or not verify_password(form.password, user.hashed_password):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    verified, new_hash = verify_and_update_password(form.password, user.hashed_password)
+    if not verified:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     access_token = create_access_token(
         data={
             "sub": user.username,
-            "ver": user.token_version or 0
+            "ver": user.token_version or 0,
         },
-        expires_delta=timedelta(minutes=settings.access_token_expire_minutes),
     )
+    if new_hash:
+        # 기존 bcrypt 해시를 argon2로 교체 (이후 로그인은 더 빠른 검증 경로 사용)
+        user.hashed_password = new_hash
+        db.commit()
     return {"access_token": access_token, "token_type": "bearer"}
 
 
@@ -53,20 +60,27 @@ def username_exists(
     username: str = Query(min_length=3, max_length=50),
     db: Session = Depends(get_db),
 ) -> UsernameExists:
-    exists = db.query(User.id).filter(User.username == username).first() is not None
+    # ORM 행 생성 없이 유니크 인덱스만으로 존재 여부 확인
+    exists = db.execute(
+        select(literal(1)).where(User.username == username).limit(1)
+    ).scalar() is not None
     return UsernameExists(exists=exists)
 
 
 @router.get("/me", response_model=UserOut)
 def me(current_user: User = Depends(get_current_user)):
+    # 프로필은 토큰이 아닌 사용자 캐시(_load_user, TTL 5분) 경로에서 조회
     return current_user
 
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 def logout(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    current_user.token_version = (current_user.token_version or 0) + 1
+    username = current_user.username
+    old_token_version = current_user.token_version or 0
+    current_user.token_version = old_token_version + 1
     db.add(current_user)
     db.commit()
+    invalidate_user_caches(username, old_token_version)
     resp = Response(status_code=status.HTTP_204_NO_CONTENT)
     resp.delete_cookie("access_token")
     resp.delete_cookie("refreshToken")
@@ -78,6 +92,9 @@ def quit_account(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    username = current_user.username
+    token_version = current_user.token_version or 0
     db.delete(current_user)
     db.commit()
+    invalidate_user_caches(username, token_version)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
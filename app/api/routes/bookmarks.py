@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, status, Query
 from typing import List
 from datetime import datetime
 from pymongo.database import Database
 
+from app.core.settings import settings
 from app.db.mongodb import get_mongo_db
 from app.api.deps import get_current_user
 from app.models.user import User
@@ -12,7 +13,13 @@ from app.schemas.bookmark import (
     BookmarkUpdate,
     BookmarkListOut,
 )
-from app.utils.mongodb import safe_object_id, serialize_object_id
+from app.utils.mongodb import (
+    MongoJSONResponse,
+    cursor_filter,
+    encode_cursor,
+    safe_object_id,
+    serialize_object_id,
+)
 from app.utils.activity_logger import log_activity
 
 router = APIRouter(prefix="/bookmarks", tags=["bookmarks"])
@@ -21,6 +28,7 @@ router = APIRouter(prefix="/bookmarks", tags=["bookmarks"])
 @router.post("", response_model=BookmarkOut, status_code=status.HTTP_201_CREATED)
 def create_bookmark(
     payload: BookmarkCreate,
+    background: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Database = Depends(get_mongo_db),
 ):
@@ -38,8 +46,9 @@ def create_bookmark(
     serialize_object_id(doc, "_id", "paper_id")
     doc["id"] = doc.pop("_id")
     
-    # 북마크 활동 로그
-    log_activity(
+    # 북마크 활동 로그 (응답 이후 백그라운드 기록)
+    background.add_task(
+        log_activity,
         db=db,
         user_id=current_user.id,
         activity_type="bookmark",
@@ -49,29 +58,50 @@ def create_bookmark(
     return BookmarkOut(**doc)
 
 
-@router.get("", response_model=BookmarkListOut)
+# 응답 검증/재직렬화를 생략하고 orjson으로 바로 응답 (스키마는 문서화용으로만 사용)
+@router.get("", response_model=None, responses={200: {"model": BookmarkListOut}})
 def list_bookmarks(
     current_user: User = Depends(get_current_user),
     paper_id: str | None = Query(None, description="특정 논문 북마크만 조회"),
+    limit: int = Query(100, ge=1, le=1000, description="조회할 북마크 수 (기본 100, 최대 1000)"),
+    cursor: str | None = Query(None, description="이전 페이지의 next_cursor (이 북마크 이후의 더 오래된 북마크만 조회)"),
     db: Database = Depends(get_mongo_db),
 ):
     query = {"user_id": current_user.id}
     if paper_id:
         query["paper_id"] = safe_object_id(paper_id, "paper ID")
     
-    cursor = db["bookmarks"].find(query).sort("bookmarked_at", -1)
-    items = []
-    for doc in cursor:
-        serialize_object_id(doc, "_id", "paper_id")
-        doc["id"] = doc.pop("_id")
-        items.append(BookmarkOut(
-            id=doc["id"],
-            user_id=doc["user_id"],
-            paper_id=doc["paper_id"],
-            bookmarked_at=doc["bookmarked_at"],
-            notes=doc.get("notes"),
-        ))
-    return BookmarkListOut(items=items)
+    # 전체 개수는 커서와 무관하게 사용자 기준으로 계산 (user_bookmarked_at_id 인덱스 사용)
+    total = db["bookmarks"].count_documents(query)
+    
+    # 커서 기반 페이지네이션: $match를 정렬 앞에 두어 (user_id, bookmarked_at, _id) 인덱스 범위로 조회
+    # 같은 시각의 북마크가 경계에서 빠지지 않도록 _id까지 비교
+    if cursor is not None:
+        query.update(cursor_filter(cursor, "bookmarked_at"))
+    
+    # 정렬/ObjectId 문자열 변환을 한 번의 aggregation으로 처리
+    pipeline = [
+        {"$match": query},
+        {"$sort": {"bookmarked_at": -1, "_id": -1}},
+        {"$limit": limit},
+        {"$project": {
+            "_id": 0,
+            "id": {"$toString": "$_id"},
+            "user_id": 1,
+            "paper_id": {"$toString": "$paper_id"},
+            "bookmarked_at": 1,
+            "notes": {"$ifNull": ["$notes", None]},
+        }},
+    ]
+    
+    # 직접 저장한 문서를 위 $project로 정형화했으므로 모델 생성 없이 그대로 응답
+    items = list(db["bookmarks"].aggregate(pipeline, batchSize=min(limit, 500)))
+    next_cursor = encode_cursor(items[-1]["bookmarked_at"], items[-1]["id"]) if len(items) == limit else None
+    result = {"items": items, "total": total, "next_cursor": next_cursor}
+    if settings.app_env == "local":
+        # 개발 환경에서만 응답 스키마 일치 여부 확인 (운영에서는 검증 비용 생략)
+        BookmarkListOut.model_validate(result)
+    return MongoJSONResponse(result)
 
 
 @router.put("/{bookmark_id}", response_model=BookmarkOut)
@@ -110,28 +140,30 @@ def update_bookmark(
 @router.delete("/{bookmark_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_bookmark(
     bookmark_id: str,
+    background: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Database = Depends(get_mongo_db),
 ):
     obj_id = safe_object_id(bookmark_id, "bookmark ID")
     
-    # 삭제 전에 paper_id 조회 (활동 로그용)
-    bookmark_doc = db["bookmarks"].find_one({"_id": obj_id, "user_id": current_user.id})
+    # 조회와 삭제를 한 번에 처리 (paper_id는 활동 로그용)
+    bookmark_doc = db["bookmarks"].find_one_and_delete(
+        {"_id": obj_id, "user_id": current_user.id},
+        projection={"paper_id": 1},
+    )
     if not bookmark_doc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Bookmark not found"
         )
     
-    result = db["bookmarks"].delete_one({"_id": obj_id, "user_id": current_user.id})
-    
-    # 북마크 취소 활동 로그
-    if result.deleted_count > 0:
-        log_activity(
-            db=db,
-            user_id=current_user.id,
-            activity_type="unbookmark",
-            paper_id=str(bookmark_doc["paper_id"])
-        )
+    # 북마크 취소 활동 로그 (응답 이후 백그라운드 기록)
+    background.add_task(
+        log_activity,
+        db=db,
+        user_id=current_user.id,
+        activity_type="unbookmark",
+        paper_id=str(bookmark_doc["paper_id"])
+    )
     
-    return
\ No newline at end of file
+    return
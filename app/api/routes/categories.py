@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from app.db.postgres import get_db
 from app.models.category import Category, CategoryName
 from app.seed.categories_seed import seed_categories
+from app.utils.category_index import invalidate_category_index
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
@@ -16,6 +17,7 @@ def seed(force: bool = False, db: Session = Depends(get_db)):
         seed_categories(db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"seed failed: {e}")
+    invalidate_category_index()
     return {
         "seeded": True,
         "categories": db.query(Category).count(),
@@ -1,34 +1,72 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Depends
 from typing import List
-import math
+import re
+import threading
 import logging
 from datetime import datetime
+from bson.regex import Regex
 from pymongo.database import Database
+from pymongo.errors import OperationFailure
+from cachetools import TTLCache
 
-from app.db.mongodb import get_mongo_db
+from app.db.mongodb import get_mongo_db, PAPERS_EXCLUDE_SEARCH_FIELDS
 from app.core.settings import settings
 from app.schemas.paper import (
     Paper,
     PaperSearchResponse,
     SearchHistoryResponse,
-    SearchHistoryItem,
-    SearchHistoryFilters,
 )
-from app.utils.mongodb import safe_object_id, serialize_object_id
+from app.utils.mongodb import (
+    MongoJSONResponse,
+    cursor_filter,
+    encode_cursor,
+    safe_object_id,
+    serialize_object_id,
+)
 from app.utils.activity_logger import log_activity
+from app.utils.ngram import make_ngrams, NGRAM_SIZE
 from app.api.deps import get_current_user
 from app.models.user import User
 
 router = APIRouter(prefix="/papers", tags=["papers"])
 logger = logging.getLogger(__name__)
 
+# text 인덱스로 검색 가능한 단어(문자/숫자)가 있는지 판별
+_TEXT_SEARCHABLE = re.compile(r"\w")
+
+# 검색 결과 페이지 크기
+_PAGE_SIZE = 10
+
+# $text 검색 시 text 인덱스가 없을 때의 서버 오류 코드 (IndexNotFound)
+_INDEX_NOT_FOUND = 27
+
+# 검색 결과 projection (요청마다 dict를 새로 만들지 않도록 모듈 상수로 유지, 수정 금지)
+# _id는 키셋 커서 계산용으로만 조회하고 응답 전에 제거 (Paper 스키마에 노출되지 않는 필드)
+_PAPER_PROJECTION = {
+    "_id": 1,
+    "id": 1,
+    "title": 1,
+    "abstract": 1,
+    "authors": 1,
+    "categories": 1,
+    "update_date": 1,
+}
+# $text 검색 시 관련도 점수 포함
+_PAPER_TEXT_PROJECTION = {**_PAPER_PROJECTION, "score": {"$meta": "textScore"}}
+
+# 검색 결과 개수 캐시 (TTL 1분, 최대 4096개)
+# Key: (검색어, 정렬된 카테고리 튜플), n-gram 재검색은 앞에 "ngram" 추가
+search_count_cache = TTLCache(maxsize=4096, ttl=60)
+_search_count_lock = threading.Lock()
+
 
 def save_search_history(
     db: Database,
     user_id: int,
     query: str | None,
     categories: List[str] | None,
-    result_count: int
+    result_count: int,
+    searched_at: datetime | None = None,
 ) -> None:
     """
     검색 기록을 MongoDB에 저장.
@@ -39,6 +77,7 @@ def save_search_history(
         query: 검색어
         categories: 카테고리 필터
         result_count: 검색 결과 개수
+        searched_at: 검색 시각 (백그라운드 실행 시 요청 시각 전달, 없으면 현재 시각)
     """
     history_doc = {
         "user_id": user_id,
@@ -47,7 +86,7 @@ def save_search_history(
             "categories": categories or []
         },
         "result_count": result_count,
-        "searched_at": datetime.utcnow()
+        "searched_at": searched_at or datetime.utcnow()
     }
     
     try:
@@ -58,57 +97,220 @@ def save_search_history(
         # 검색 기록 저장 실패는 검색 자체에 영향 주지 않음
 
 
-@router.get("/search", response_model=PaperSearchResponse)
+def _build_search_filter(
+    q: str | None,
+    categories: List[str] | None,
+    use_text: bool = True,
+) -> tuple[dict, dict, list | None]:
+    """
+    $text 인덱스(또는 regex 대체) 기반 검색 필터, projection, 정렬 조건 생성.
+    text 검색 시 관련도 점수가 포함된 projection을 반환함.
+    
+    Args:
+        use_text: False면 단어가 있는 검색어도 regex로 검색 (text 인덱스가 아직 없을 때)
+    """
+    query = {}
+    projection = _PAPER_PROJECTION
+    sort = None
+    if use_text and q and _TEXT_SEARCHABLE.search(q):
+        # text 인덱스 검색 + 관련도 순 정렬
+        query["$text"] = {"$search": q}
+        projection = _PAPER_TEXT_PROJECTION
+        sort = [("score", {"$meta": "textScore"})]
+    elif q:
+        # 단어가 없는 검색어(기호 등)는 text 엔진이 처리하지 못하므로 regex로 대체
+        # (text 인덱스가 아직 생성되지 않은 경우에도 사용)
+        # 적재 시 만든 소문자 결합 필드 하나만 검사 (대소문자 무시 옵션 불필요)
+        # BSON Regex로 직접 전달해 드라이버의 re.Pattern 플래그 변환 생략
+        pattern = re.escape(q)
+        ignore_case = Regex(pattern, "i")
+        query["$or"] = [
+            {"search_blob": Regex(re.escape(q.lower()))},
+            # search_blob 도입 전에 적재/복제된 문서는 원본 필드를 대소문자 무시로 검사
+            {"search_blob": {"$exists": False}, "$or": [
+                {"title": ignore_case},
+                {"abstract": ignore_case},
+                {"authors": ignore_case},
+            ]},
+        ]
+    if categories:
+        query["categories"] = {"$in": categories}
+    return query, projection, sort
+
+
+def _build_ngram_filter(q: str, categories: List[str] | None) -> dict | None:
+    """
+    제목 n-gram 기반 부분 문자열 검색 필터 생성.
+    검색어가 n-gram 길이보다 짧으면 None 반환.
+    """
+    grams = make_ngrams(q)
+    if not grams:
+        return None
+    query = {"title_ngrams": {"$all": grams}}
+    if categories:
+        query["categories"] = {"$in": categories}
+    return query
+
+
+def _count_search_results(coll, query: dict, key: tuple) -> int:
+    """
+    검색 결과 전체 개수 반환.
+    - 필터가 없으면 컬렉션 메타데이터 기반 estimated_document_count 사용
+    - 그 외에는 같은 검색 조건(key)의 개수를 짧게 캐시해 페이지 이동마다 재계산하지 않음
+    """
+    if not query:
+        return coll.estimated_document_count()
+
+    with _search_count_lock:
+        cached = search_count_cache.get(key)
+    if cached is not None:
+        return cached
+
+    total = coll.count_documents(query)
+    with _search_count_lock:
+        search_count_cache[key] = total
+    return total
+
+
+def _atlas_search(
+    coll,
+    q: str,
+    categories: List[str] | None,
+    skip: int,
+    page_size: int,
+) -> tuple[list[dict], int]:
+    """
+    Atlas Search($search)로 논문 검색.
+    결과 목록과 전체 개수를 한 번의 aggregation($facet)으로 조회.
+    """
+    pipeline = [
+        {"$search": {
+            "index": settings.mongo_search_index,
+            "text": {"query": q, "path": ["title", "abstract", "authors"]},
+        }},
+    ]
+    if categories:
+        pipeline.append({"$match": {"categories": {"$in": categories}}})
+    pipeline.append({"$facet": {
+        "items": [{"$skip": skip}, {"$limit": page_size}, {"$project": _PAPER_PROJECTION}],
+        "total": [{"$count": "count"}],
+    }})
+    result = next(coll.aggregate(pipeline), {"items": [], "total": []})
+    total = result["total"][0]["count"] if result["total"] else 0
+    return result["items"], total
+
+
+def _local_search(
+    coll,
+    q: str | None,
+    categories: List[str] | None,
+    keyset: bool,
+    after: str | None,
+    skip: int,
+    page_size: int,
+    use_text: bool,
+) -> tuple[list[dict], int, bool]:
+    """
+    $text(또는 regex/n-gram) 기반 논문 검색.
+    
+    Returns:
+        (현재 페이지 문서, 전체 개수, 다음 페이지 존재 여부)
+    
+    Raises:
+        OperationFailure: use_text=True인데 text 인덱스가 없는 경우 등
+    """
+    query, projection, sort = _build_search_filter(q, categories, use_text)
+    count_key = (q, tuple(sorted(categories or [])))
+    if not use_text:
+        # text 검색 결과 개수와 캐시 키가 겹치지 않도록 구분
+        count_key = ("regex",) + count_key
+    total = _count_search_results(coll, query, count_key)
+    if total == 0 and "$text" in query and len(q.strip()) >= NGRAM_SIZE:
+        # $text는 단어 단위로만 매칭하므로 결과가 없으면 제목 n-gram으로 부분 문자열 재검색
+        ngram_query = _build_ngram_filter(q, categories)
+        if ngram_query:
+            query, projection, sort = ngram_query, _PAPER_PROJECTION, None
+            total = _count_search_results(coll, query, ("ngram",) + count_key)
+    if keyset:
+        sort = [("_id", -1)]
+        if after:
+            query["_id"] = {"$lt": safe_object_id(after, "cursor")}
+            skip = 0
+    # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+    docs = list(
+        coll.find(query, projection, sort=sort)
+        .skip(skip)
+        .limit(page_size + 1)
+        .batch_size(page_size + 1)
+    )
+    return docs[:page_size], total, len(docs) > page_size
+
+
+# 응답 검증/재직렬화를 생략하고 orjson으로 바로 응답 (스키마는 문서화용으로만 사용)
+@router.get("/search", response_model=None, responses={200: {"model": PaperSearchResponse}})
 def search_papers(
+    background: BackgroundTasks,
     q: str | None = Query(None, min_length=1, description="검색어"),
     categories: List[str] | None = Query(None, description="카테고리 코드(복수 선택 가능)"),
     page: int = Query(1, ge=1, description="페이지 (1부터)"),
+    after: str | None = Query(None, description="이전 응답의 next_cursor (관련도 정렬이 아닌 검색에서 skip 없이 다음 페이지 조회)"),
     db: Database = Depends(get_mongo_db),
     current_user: User = Depends(get_current_user),  # 인증 필수
 ):
     coll = db[settings.mongo_collection]
-
-    query = {}
-    if q:
-        regex = {"$regex": q, "$options": "i"}
-        query["$or"] = [{"title": regex}, {"abstract": regex}, {"authors": regex}]
-    if categories:
-        query["categories"] = {"$in": categories}
-
-    projection = {
-        "_id": 1,
-        "id": 1,
-        "title": 1,
-        "abstract": 1,
-        "authors": 1,
-        "categories": 1,
-        "update_date": 1,
-    }
-
-    page_size = 10
+    page_size = _PAGE_SIZE
     skip = (page - 1) * page_size
 
-    total = coll.count_documents(query)
-    total_pages = max(1, math.ceil(total / page_size)) if total else 0
+    # 관련도 정렬(Atlas Search/$text)이 없는 검색만 _id 역순 키셋 페이지네이션 사용
+    use_atlas = bool(q and settings.mongo_search_index)
+    keyset = not use_atlas and not (q and _TEXT_SEARCHABLE.search(q))
+    if after and not keyset:
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination is not supported for relevance-ranked search",
+        )
+
+    if use_atlas:
+        # Atlas Search 사용 시 검색/개수 조회를 한 번에 처리
+        docs, total = _atlas_search(coll, q, categories, skip, page_size)
+        has_next = skip + page_size < total
+    else:
+        try:
+            docs, total, has_next = _local_search(
+                coll, q, categories, keyset, after, skip, page_size, use_text=True
+            )
+        except OperationFailure as e:
+            if e.code != _INDEX_NOT_FOUND:
+                raise
+            # 신규 배포/대용량 컬렉션의 text 인덱스 생성 중에는 regex 검색으로 대체
+            logger.warning("papers text index not available, falling back to regex search")
+            docs, total, has_next = _local_search(
+                coll, q, categories, keyset, after, skip, page_size, use_text=False
+            )
+    total_pages = -(-total // page_size)  # 올림 나눗셈 (total이 0이면 0)
 
-    cursor = coll.find(query, projection).skip(skip).limit(page_size)
-    items = []
-    for doc in cursor:
-        serialize_object_id(doc)
-        items.append(doc)
+    next_cursor = str(docs[-1]["_id"]) if keyset and has_next else None
+    # Paper 스키마에 없는 내부 필드(_id, 관련도 점수)는 제거해 기존 response_model과 같은 응답 형태 유지
+    for doc in docs:
+        doc.pop("_id", None)
+        doc.pop("score", None)
+    items = docs
 
-    # 검색 기록 저장 (검색어나 카테고리가 있을 때만)
+    # 검색 기록 저장 (검색어나 카테고리가 있을 때만, 응답 이후 백그라운드 기록)
     if q or categories:
-        save_search_history(
+        background.add_task(
+            save_search_history,
             db=db,
             user_id=current_user.id,
             query=q,
             categories=categories,
-            result_count=total
+            result_count=total,
+            searched_at=datetime.utcnow(),
         )
         
         # 검색 활동 로그
-        log_activity(
+        background.add_task(
+            log_activity,
             db=db,
             user_id=current_user.id,
             activity_type="search",
@@ -119,21 +321,32 @@ def search_papers(
             }
         )
 
-    return {
+    result = {
         "page": page,
         "page_size": page_size,
         "total": total,
         "total_pages": total_pages,
-        "has_next": page < total_pages,
-        "has_prev": page > 1,
+        "has_next": has_next,
+        "has_prev": page > 1 or after is not None,
+        "next_cursor": next_cursor,
         "items": items,
     }
+    if settings.app_env == "local":
+        # 개발 환경에서만 응답 스키마 일치 여부 확인 (운영에서는 검증 비용 생략)
+        # model_validate는 추가 필드를 무시하므로 스키마에 없는 필드 노출도 별도로 확인
+        PaperSearchResponse.model_validate(result)
+        extra = {key for item in items for key in item} - Paper.model_fields.keys()
+        if extra:
+            logger.warning(f"search response items contain fields outside Paper: {sorted(extra)}")
+    return MongoJSONResponse(result)
 
 
-@router.get("/search-history", response_model=SearchHistoryResponse)
+# 응답 검증/재직렬화를 생략하고 orjson으로 바로 응답 (스키마는 문서화용으로만 사용)
+@router.get("/search-history", response_model=None, responses={200: {"model": SearchHistoryResponse}})
 def get_search_history(
     user_id: int | None = Query(None, description="사용자 ID로 필터링"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 기록 수"),
+    cursor: str | None = Query(None, description="이전 페이지의 next_cursor (이 기록 이후의 더 오래된 기록만 조회)"),
     db: Database = Depends(get_mongo_db),
 ):
     """
@@ -145,6 +358,7 @@ def get_search_history(
     Args:
         user_id: 특정 사용자의 검색 기록만 조회
         limit: 조회할 기록 수 (기본 100, 최대 1000)
+        cursor: 다음 페이지 조회용 커서 (응답의 next_cursor 값)
         db: MongoDB Database
     
     Returns:
@@ -158,38 +372,60 @@ def get_search_history(
     
     total = collection.count_documents(query)
     
-    cursor = collection.find(query).sort("searched_at", -1).limit(limit)
+    # 커서 기반 페이지네이션 ((searched_at, _id) 범위 조회, 같은 시각 기록이 경계에서 빠지지 않도록)
+    if cursor is not None:
+        query.update(cursor_filter(cursor, "searched_at"))
     
-    items = []
-    for doc in cursor:
-        serialize_object_id(doc)
-        doc["id"] = doc.pop("_id")
-        
-        # mock 데이터 호환: 필수 필드 없으면 None 처리
-        doc.setdefault("user_id", None)
-        doc.setdefault("filters", None)
-        doc.setdefault("result_count", None)
-        
-        items.append(SearchHistoryItem(**doc))
+    # id 변환과 누락 필드 기본값 처리를 Mongo $project에서 수행
+    pipeline = [
+        {"$match": query},
+        {"$sort": {"searched_at": -1, "_id": -1}},
+        {"$limit": limit},
+        {"$project": {
+            "_id": 0,
+            "id": {"$toString": "$_id"},
+            "query": 1,
+            "searched_at": 1,
+            # mock 데이터 호환: 필수 필드 없으면 None 처리
+            "user_id": {"$ifNull": ["$user_id", None]},
+            # filters가 있으면 categories 기본값([]) 적용
+            "filters": {"$cond": [
+                {"$eq": [{"$type": "$filters"}, "object"]},
+                {"categories": {"$ifNull": ["$filters.categories", []]}},
+                None,
+            ]},
+            "result_count": {"$ifNull": ["$result_count", None]},
+        }},
+    ]
+    
+    # 서버가 기록한 문서를 위 $project로 정형화했으므로 모델 생성 없이 그대로 응답
+    items = list(collection.aggregate(pipeline, batchSize=min(limit, 500)))
     
-    return SearchHistoryResponse(total=total, items=items)
+    next_cursor = encode_cursor(items[-1]["searched_at"], items[-1]["id"]) if len(items) == limit else None
+    result = {"total": total, "items": items, "next_cursor": next_cursor}
+    if settings.app_env == "local":
+        # 개발 환경에서만 응답 스키마 일치 여부 확인 (운영에서는 검증 비용 생략)
+        SearchHistoryResponse.model_validate(result)
+    return MongoJSONResponse(result)
 
 
 @router.get("/{paper_id}", response_model=Paper)
 def get_paper(
     paper_id: str,
+    background: BackgroundTasks,
     db: Database = Depends(get_mongo_db),
     current_user: User = Depends(get_current_user),  # 인증 필수
 ):
     coll = db[settings.mongo_collection]
 
     oid = safe_object_id(paper_id, "paper ID")
-    doc = coll.find_one({"_id": oid})
+    doc = coll.find_one({"_id": oid}, PAPERS_EXCLUDE_SEARCH_FIELDS)
     if not doc:
         raise HTTPException(status_code=404, detail="Paper not found")
     
-    # 논문 조회 활동 로그
-    log_activity(
+    # 논문 조회 활동 로그 (응답 이후 백그라운드 기록)
+    background.add_task(
+        log_activity,
         db=db,
         user_id=current_user.id,
         activity_type="view",
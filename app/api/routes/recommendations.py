@@ -1,7 +1,7 @@
 """
 추천 시스템 API 엔드포인트.
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from sqlalchemy.orm import Session
 from pymongo.database import Database
 from datetime import datetime
@@ -35,16 +35,16 @@ def _log_recommendation(
         recommendations: 추천 결과 리스트
         recommendation_type: 추천 타입
     """
-    collection = db["paper_recommendations"]
-    
+    if not recommendations:
+        return
+
+    recommended_at = datetime.utcnow()
+    log_docs = []
     for rec in recommendations:
-        paper_id = rec.get("paper_id")
         breakdown = rec.get("breakdown", {})
-        reasons = rec.get("reasons", [])
-        
-        log_doc = {
+        log_docs.append({
             "user_id": user_id,
-            "paper_id": paper_id,
+            "paper_id": rec.get("paper_id"),
             "recommendation_type": recommendation_type,
             "score": rec.get("total_score", 0.0),
             "features": {
@@ -54,20 +54,22 @@ def _log_recommendation(
                 "personalization_score": breakdown.get("personalization_score", 0.0)
             },
             "context": {
-                "reasons": reasons
+                "reasons": rec.get("reasons", [])
             },
             "was_clicked": False,  # 초기값
-            "recommended_at": datetime.utcnow()
-        }
-        
-        try:
-            collection.insert_one(log_doc)
-        except Exception as e:
-            logger.error(f"Failed to log recommendation: {e}")
+            "recommended_at": recommended_at
+        })
+
+    # 한 번의 insert_many로 일괄 기록 (ordered=False: 일부 실패해도 나머지는 저장)
+    try:
+        db["paper_recommendations"].insert_many(log_docs, ordered=False)
+    except Exception as e:
+        logger.error(f"Failed to log {len(log_docs)} recommendations: {e}")
 
 
 @router.get("", response_model=RecommendationResponse)
 def get_recommendations(
+    background: BackgroundTasks,
     top_k: int = Query(10, ge=1, le=50, description="추천 논문 개수"),
     db_postgres: Session = Depends(get_db),
     db_mongo: Database = Depends(get_mongo_db),
@@ -96,11 +98,12 @@ def get_recommendations(
         candidate_limit=100
     )
     
-    # 추천 로깅
-    _log_recommendation(
+    # 추천 로깅 (응답 이후 백그라운드에서 실행)
+    background.add_task(
+        _log_recommendation,
         db=db_mongo,
         user_id=current_user.id,
-        recommendations=recommendations
+        recommendations=recommendations,
     )
     
     # 응답 생성
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import case, delete, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
 from app.db.postgres import get_db
 from app.models.user import User
-from app.models.category import Category
+from app.models.category import Category, CategoryName
 from app.models.user_interest import UserInterest
+from app.utils.category_index import get_category_index
 from app.schemas.user_interest import (
     InterestAddPayload,
     InterestItem,
@@ -16,41 +19,59 @@ from app.schemas.user_interest import (
 router = APIRouter(prefix="/user-interests", tags=["user-interests"])
 
 
+def _list_interest_items(db: Session, user_id: int) -> list[InterestItem]:
+    """
+    사용자 관심 카테고리 목록을 ko/en 이름과 함께 단일 쿼리로 조회.
+    (카테고리별 names 지연 로딩으로 인한 N+1 방지)
+    """
+    rows = (
+        db.query(
+            Category.code,
+            func.max(case((CategoryName.locale == "ko", CategoryName.name))).label("name_ko"),
+            func.max(case((CategoryName.locale == "en", CategoryName.name))).label("name_en"),
+        )
+        .join(UserInterest, UserInterest.category_id == Category.id)
+        .outerjoin(CategoryName, CategoryName.category_id == Category.id)
+        .filter(UserInterest.user_id == user_id)
+        .group_by(Category.code)
+        .order_by(Category.code.asc())
+        .all()
+    )
+    return [InterestItem(code=code, name_ko=name_ko, name_en=name_en) for code, name_ko, name_en in rows]
+
+
 @router.post("", status_code=status.HTTP_201_CREATED)
 def add_interests(
     payload: InterestAddPayload,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    codes = list(dict.fromkeys(payload.category_codes))
+    codes = frozenset(payload.category_codes)
     if not codes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="empty category_codes"
         )
 
-    categories = db.query(Category).filter(Category.code.in_(codes)).all()
-    found_codes = {c.code for c in categories}
-    missing = [c for c in codes if c not in found_codes]
+    # 카테고리는 거의 변하지 않으므로 메모리 인덱스로 코드 → id 변환
+    index = get_category_index(db)
+    missing = sorted(codes - index.keys())
     if missing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"categories not found: {missing}"
         )
 
-    existing = db.query(UserInterest).filter(
-        UserInterest.user_id == current_user.id,
-        UserInterest.category_id.in_([c.id for c in categories])
-    ).all()
-    existing_ids = {e.category_id for e in existing}
-
-    for c in categories:
-        if c.id in existing_ids:
-            continue
-        db.add(UserInterest(user_id=current_user.id, category_id=c.id))
-
+    # 단일 INSERT로 일괄 추가, 이미 있는 관심사는 ON CONFLICT로 건너뜀
+    stmt = (
+        insert(UserInterest)
+        .values([{"user_id": current_user.id, "category_id": index[c].id} for c in codes])
+        .on_conflict_do_nothing(index_elements=["user_id", "category_id"])
+        .returning(UserInterest.category_id)
+    )
+    added = len(db.execute(stmt).all())
     db.commit()
-    return {"added": len(categories) - len(existing_ids), "skipped": len(existing_ids)}
+    return {"added": added, "skipped": len(codes) - added}
 
 
 @router.get("", response_model=InterestList)
@@ -58,21 +79,7 @@ def list_interests(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = (
-        db.query(Category)
-        .join(UserInterest, UserInterest.category_id == Category.id)
-        .filter(UserInterest.user_id == current_user.id)
-        .order_by(Category.code.asc())
-    )
-    categories = q.all()
-
-    items: list[InterestItem] = []
-    for c in categories:
-        name_ko = next((n.name for n in c.names if n.locale == "ko"), None)
-        name_en = next((n.name for n in c.names if n.locale == "en"), None)
-        items.append(InterestItem(code=c.code, name_ko=name_ko, name_en=name_en))
-
-    return InterestList(items=items)
+    return InterestList(items=_list_interest_items(db, current_user.id))
 
 
 @router.delete("", response_model=InterestRemovalResult)
@@ -81,46 +88,35 @@ def remove_interests(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    target_codes = list(dict.fromkeys(codes))
+    target_codes = frozenset(codes)
     if not target_codes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="empty codes"
         )
 
-    categories = db.query(Category).filter(Category.code.in_(target_codes)).all()
-    found_map = {c.code: c for c in categories}
-    missing = [c for c in target_codes if c not in found_map]
-
-    to_delete = (
-        db.query(UserInterest)
-        .filter(
-            UserInterest.user_id == current_user.id,
-            UserInterest.category_id.in_([found_map[c].id for c in found_map])
-        )
-        .all()
-    )
-    delete_ids = {ui.category_id for ui in to_delete}
-
-    for ui in to_delete:
-        db.delete(ui)
+    index = get_category_index(db)
+    missing = sorted(target_codes - index.keys())
+    target_ids = [index[c].id for c in target_codes & index.keys()]
+
+    # 단일 DELETE ... RETURNING으로 처리
+    deleted = []
+    if target_ids:
+        deleted = db.execute(
+            delete(UserInterest)
+            .where(
+                UserInterest.user_id == current_user.id,
+                UserInterest.category_id.in_(target_ids),
+            )
+            .returning(UserInterest.category_id)
+        ).all()
+
+    # 같은 트랜잭션에서 남은 목록 조회 후 한 번만 커밋
+    remaining_items = _list_interest_items(db, current_user.id)
     db.commit()
 
-    q = (
-        db.query(Category)
-        .join(UserInterest, UserInterest.category_id == Category.id)
-        .filter(UserInterest.user_id == current_user.id)
-        .order_by(Category.code.asc())
-    )
-    remaining_categories = q.all()
-    remaining_items = []
-    for c in remaining_categories:
-        name_ko = next((n.name for n in c.names if n.locale == "ko"), None)
-        name_en = next((n.name for n in c.names if n.locale == "en"), None)
-        remaining_items.append(InterestItem(code=c.code, name_ko=name_ko, name_en=name_en))
-
     return InterestRemovalResult(
-        removed=len(delete_ids),
+        removed=len(deleted),
         not_found=missing,
         remaining=InterestList(items=remaining_items),
     )
\ No newline at end of file
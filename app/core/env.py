@@ -2,14 +2,22 @@ from pathlib import Path
 import os
 from dotenv import load_dotenv
 
+_BASE_DIR = Path(__file__).resolve().parents[2]  # 프로젝트 루트
+
+# 이미 로드한 env 파일 (프로세스당 한 번만 파싱)
+_LOADED: set[Path] = set()
+
 def load_env() -> None:
     """
     APP_ENV(local/prod/...)에 따라 env/<APP_ENV>/.env 로드.
     - 파일이 없으면 조용히 무시
     - 이미 설정된 환경변수는 덮어쓰지 않음(override=False)
+    - 같은 파일은 여러 번 호출해도 한 번만 로드
     """
     app_env = os.getenv("APP_ENV", "local")
-    base_dir = Path(__file__).resolve().parents[2]  # 프로젝트 루트
-    env_path = base_dir / "env" / app_env / ".env"
+    env_path = _BASE_DIR / "env" / app_env / ".env"
+    if env_path in _LOADED:
+        return
     if env_path.is_file():
-        load_dotenv(env_path, override=False)
\ No newline at end of file
+        load_dotenv(env_path, override=False)
+        _LOADED.add(env_path)
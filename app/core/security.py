@@ -1,10 +1,68 @@
-from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import hmac
+import json
+import orjson
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional, Any, Dict
 from passlib.context import CryptContext
 from jose import jwt
 from app.core.settings import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 신규 해시는 argon2id(bcrypt 12 rounds보다 짧은 시간에 동등 이상 강도), 기존 bcrypt 해시는 검증만 지원
+# deprecated="auto": bcrypt 해시는 로그인 성공 시 argon2로 재해시 대상
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    default="argon2",
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,  # KiB (19 MiB)
+    argon2__parallelism=1,
+)
+
+
+# HMAC 계열 JWT 서명 알고리즘 → 해시 함수
+_HMAC_ALGORITHMS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+@lru_cache(maxsize=1)
+def _jwt_params() -> tuple[bytes, bytes, int]:
+    """
+    (인코딩된 JWT 헤더, 서명 키 bytes, 기본 만료 초)를 첫 토큰 발급 시 한 번만 계산.
+    알고리즘/키는 프로세스 동안 고정이며, import 시점에 설정을 읽지 않도록 지연 계산.
+    """
+    header_b64 = _b64url(
+        json.dumps({"alg": settings.jwt_algorithm, "typ": "JWT"}, separators=(",", ":")).encode()
+    )
+    return (
+        header_b64,
+        settings.secret_key.encode("utf-8"),
+        settings.access_token_expire_minutes * 60,
+    )
+
+
+def _encode_hmac_jwt(payload: Dict[str, Any]) -> str:
+    """
+    HS* 알고리즘 JWT 직접 서명 (미리 인코딩한 헤더 + hmac/hashlib의 OpenSSL 경로 사용).
+    """
+    header_b64, secret_bytes, _ = _jwt_params()
+    payload_b64 = _b64url(orjson.dumps(payload))  # 공백 없는 compact JSON을 bytes로 바로 생성
+    signing_input = header_b64 + b"." + payload_b64
+    signature = hmac.new(
+        secret_bytes, signing_input, _HMAC_ALGORITHMS[settings.jwt_algorithm]
+    ).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
 
 def get_password_hash(password: str) -> str:
@@ -15,10 +73,21 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 후, 기존 방식(bcrypt 등) 해시면 새 기본 방식으로 재해시.
+
+    Returns:
+        (검증 성공 여부, 교체할 새 해시 또는 None)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (
-        expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
-    )
-    to_encode.update({"exp": expire})
+    # exp는 정수 epoch (datetime 생성/시간대 연산 없이 계산)
+    expire_seconds = int(expires_delta.total_seconds()) if expires_delta else _jwt_params()[2]
+    to_encode["exp"] = int(time.time()) + expire_seconds
+    if settings.jwt_algorithm in _HMAC_ALGORITHMS:
+        return _encode_hmac_jwt(to_encode)
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
\ No newline at end of file
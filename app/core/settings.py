@@ -1,28 +1,31 @@
 from __future__ import annotations
 from pathlib import Path
 import os
-from typing import Sequence
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+@lru_cache(maxsize=1)
 def _base_dir() -> Path:
     return Path(__file__).resolve().parents[2]
 
-def _env_files() -> Sequence[Path]:
+@lru_cache(maxsize=1)
+def _env_files() -> tuple[Path, ...]:
     base = _base_dir()
     app_env = os.getenv("APP_ENV", "local")
-    candidates = [
-        base / ".env",
-        base / f".env.{app_env}",
-        base / ".env.local",
-        base / f".env.{app_env}.local",
-        base / "env" / app_env / ".env",
-    ]
-    seen = []
-    for p in candidates:
-        if p.is_file() and p not in seen:
-            seen.append(p)
-    return seen
+    # 루트의 .env* 후보는 디렉터리 한 번 스캔으로 확인 (후보마다 stat 하지 않음)
+    try:
+        with os.scandir(base) as it:
+            root_files = {e.name for e in it if e.name.startswith(".env") and e.is_file()}
+    except OSError:
+        root_files = set()
+    names = (".env", f".env.{app_env}", ".env.local", f".env.{app_env}.local")
+    # 순서를 유지하며 중복 제거 (APP_ENV=local이면 .env.local이 두 번 나옴)
+    files = [base / n for n in dict.fromkeys(names) if n in root_files]
+    nested = base / "env" / app_env / ".env"
+    if nested.is_file():
+        files.append(nested)
+    return tuple(files)
 
 class Settings(BaseSettings):
     app_env: str = Field(default="local", validation_alias="APP_ENV")
@@ -33,6 +36,10 @@ class Settings(BaseSettings):
     db_user: str = Field(default="postgres", validation_alias="POSTGRES_USER")
     db_password: str = Field(default="", validation_alias="POSTGRES_PASSWORD")
     db_name: str = Field(default="app", validation_alias="POSTGRES_DB")
+    # 연결 풀 (동시 요청 수에 맞춰 조정, pool_size + max_overflow가 최대 연결 수)
+    db_pool_size: int = Field(default=20, validation_alias="POSTGRES_POOL_SIZE")
+    db_max_overflow: int = Field(default=40, validation_alias="POSTGRES_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(default=1800, validation_alias="POSTGRES_POOL_RECYCLE")
 
     # Mongo
     mongo_host: str = Field(default="localhost", validation_alias="MONGO_HOST")
@@ -42,6 +49,8 @@ class Settings(BaseSettings):
     mongo_auth_source: str = Field(default="admin", validation_alias="MONGO_AUTH_SOURCE")
     mongo_db: str = Field(default="arxiv", validation_alias="MONGO_DB")
     mongo_collection: str = Field(default="arxiv_papers", validation_alias="MONGO_COLLECTION")
+    # Atlas Search 인덱스 이름 (설정 시 논문 검색에 $search 사용, 미설정 시 $text 인덱스 사용)
+    mongo_search_index: str | None = Field(default=None, validation_alias="MONGO_SEARCH_INDEX")
 
     # Production Mongo (for local env data copy)
     prod_mongo_host: str | None = Field(default=None, validation_alias="PROD_MONGO_HOST")
@@ -52,13 +61,15 @@ class Settings(BaseSettings):
     prod_mongo_db: str = Field(default="arxiv", validation_alias="PROD_MONGO_DB")
     prod_mongo_collection: str = Field(default="arxiv_papers", validation_alias="PROD_MONGO_COLLECTION")
 
+    # 동기(def) 라우트를 실행하는 스레드풀 크기 (Mongo 연결 풀 크기에 맞춤)
+    threadpool_size: int = Field(default=100, validation_alias="THREADPOOL_SIZE")
+
     # Auth/JWT
     secret_key: str = Field(default="change-me-in-prod", validation_alias="SECRET_KEY")
     jwt_algorithm: str = Field(default="HS256", validation_alias="JWT_ALGORITHM")
     access_token_expire_minutes: int = Field(default=60, validation_alias="ACCESS_TOKEN_EXPIRE_MINUTES")
 
     model_config = SettingsConfigDict(
-        env_file=_env_files(),
         env_file_encoding="utf-8",
         env_prefix="",
         case_sensitive=False,
@@ -66,4 +77,26 @@ class Settings(BaseSettings):
         env_ignore_empty=True,
     )
 
-settings = Settings()
\ No newline at end of file
+class _LazySettings:
+    """
+    첫 속성 접근 시 Settings를 생성하는 지연 프록시.
+    env 파일 탐색/검증을 실제로 설정이 필요한 시점까지 미룸 (일부 서브시스템만 쓰는 스크립트의 import 비용 절감).
+    """
+    __slots__ = ("_settings",)
+
+    def __init__(self) -> None:
+        self._settings: Settings | None = None
+
+    def _load(self) -> Settings:
+        if self._settings is None:
+            self._settings = Settings(_env_file=_env_files())
+        return self._settings
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        return repr(self._load())
+
+
+settings: Settings = _LazySettings()  # type: ignore[assignment]
\ No newline at end of file
@@ -11,13 +11,60 @@ logger = logging.getLogger(__name__)
 _mongo_client: MongoClient | None = None
 _mongo_db: Database | None = None
 
+# user_activities 복합 인덱스 이름 (find(hint=...)에서 참조)
+# (timestamp, _id) 커서 페이지네이션 정렬까지 인덱스로 처리하도록 _id 포함
+ACTIVITIES_FILTER_INDEX = "user_type_paper_timestamp_id"
+ACTIVITIES_USER_TYPE_INDEX = "user_type_timestamp_id"
+
+# 논문 검색용 text 인덱스 정의
+PAPERS_TEXT_INDEX = "papers_text"
+PAPERS_TEXT_INDEX_KEYS = [("title", "text"), ("abstract", "text"), ("authors", "text")]
+PAPERS_TEXT_INDEX_WEIGHTS = {"title": 10, "authors": 5, "abstract": 1}
+
+# 적재 시 만드는 검색 전용 필드 (title/abstract/authors 사본, 제목 n-gram)
+# 논문 상세/추천 조회에서는 제외해 문서 전송량을 줄임
+PAPERS_EXCLUDE_SEARCH_FIELDS = {"search_blob": 0, "title_ngrams": 0}
+
+# MongoClient 네트워크 압축 방식 (우선순위 순)
+MONGO_COMPRESSORS = "zstd,zlib"
+
+
+def _create_client(
+    host: str,
+    port: int,
+    user: str | None,
+    password: str | None,
+    auth_source: str,
+    **options,
+) -> MongoClient:
+    """
+    접속 정보로 MongoClient 생성 (앱 전역 클라이언트/prod 복제용 클라이언트 공통).
+    
+    Args:
+        host, port, user, password, auth_source: 접속 정보 (user/password 없으면 인증 생략)
+        **options: MongoClient 옵션 (타임아웃, 풀 크기 등)
+    """
+    # URI 문자열 대신 키워드 인자로 전달 (URI 파싱 생략, 비밀번호 특수문자 quote 불필요)
+    if user and password:
+        options.update(username=user, password=password, authSource=auth_source)
+    # 네트워크 압축: zstd 우선, 서버/클라이언트가 지원하지 않으면 zlib, 그다음 비압축으로 협상
+    options.setdefault("compressors", MONGO_COMPRESSORS)
+    return MongoClient(host=host, port=port, **options)
+
 
 def init_mongo() -> None:
     """
     애플리케이션 시작 시 MongoDB 클라이언트 초기화.
     FastAPI lifespan에서 호출됨.
+    이미 초기화된 경우 기존 클라이언트를 재사용 (재연결/ping/인덱스 생성 생략).
+    
+    connect=False로 생성만 하고 소켓은 첫 작업 시 연결하므로 시작을 막지 않음.
+    연결 확인과 인덱스 생성은 ensure_mongo_indexes()에서 별도로 수행.
     """
     global _mongo_client, _mongo_db
+
+    if _mongo_client is not None:
+        return
     
     host = settings.mongo_host
     port = settings.mongo_port
@@ -30,50 +77,81 @@ def init_mongo() -> None:
         logger.error("MONGO_HOST is not set. MongoDB will not be initialized.")
         return
 
-    if user and password:
-        mongo_uri = f"mongodb://{user}:{password}@{host}:{port}/?authSource={auth_source}"
-    else:
-        mongo_uri = f"mongodb://{host}:{port}/"
-
     try:
-        _mongo_client = MongoClient(
-            mongo_uri,
+        _mongo_client = _create_client(
+            host, port, user, password, auth_source,
             serverSelectionTimeoutMS=5000,
             maxPoolSize=100,  # 연결 풀 크기 명시
+            minPoolSize=10,  # 유휴 연결을 유지해 요청마다 핸드셰이크하지 않도록
+            waitQueueTimeoutMS=2000,  # 풀 고갈 시 무한 대기 대신 빠르게 실패
+            connect=False,  # 첫 작업 시 연결 (시작 시 서버 선택 대기 없음)
         )
-        # 연결 테스트
-        _mongo_client.admin.command("ping")
         _mongo_db = _mongo_client[db_name]
         logger.info(
             f"MongoDB initialized: host={host}:{port} db={db_name} "
             f"user={user or 'none'}"
         )
-        
-        # TTL 인덱스 생성
-        try:
-            # search_history: 30일 후 자동 삭제
-            _mongo_db["search_history"].create_index(
-                "searched_at",
-                expireAfterSeconds=30 * 24 * 60 * 60,  # 30일
-                name="ttl_searched_at"
-            )
-            logger.info("TTL index created for search_history (30 days)")
-            
-            # user_activities: 90일 후 자동 삭제
-            _mongo_db["user_activities"].create_index(
-                "timestamp",
-                expireAfterSeconds=90 * 24 * 60 * 60,  # 90일
-                name="ttl_timestamp"
-            )
-            logger.info("TTL index created for user_activities (90 days)")
-        except Exception as e:
-            logger.warning(f"TTL index creation failed (may already exist): {e}")
     except PyMongoError as e:
         logger.error(f"MongoDB initialization failed: {e}")
         _mongo_client = None
         _mongo_db = None
 
 
+def ensure_mongo_indexes() -> bool:
+    """
+    MongoDB 연결 확인(ping) 후 TTL/조회용 인덱스 생성.
+    lifespan에서 백그라운드로 실행되어 시작 시간에 포함되지 않음.
+    
+    Returns:
+        bool: 연결 확인 성공 여부
+    """
+    if _mongo_client is None or _mongo_db is None:
+        return False
+    db = _mongo_db
+
+    try:
+        # 연결 테스트
+        _mongo_client.admin.command("ping")
+    except PyMongoError as e:
+        logger.error(f"MongoDB ping failed: {e}")
+        return False
+
+    # (컬렉션, 키, 옵션) 목록. 하나가 실패해도(옵션 충돌, 다른 이름의 text 인덱스 등) 나머지는 계속 생성
+    index_specs = [
+        # search_history: 30일 후 자동 삭제 (TTL)
+        ("search_history", "searched_at",
+         {"expireAfterSeconds": 30 * 24 * 60 * 60, "name": "ttl_searched_at"}),
+        # search_history: 사용자별 최신순 조회/(searched_at, _id) 커서 페이지네이션용
+        ("search_history", [("user_id", 1), ("searched_at", -1), ("_id", -1)],
+         {"name": "user_searched_at_id"}),
+        # user_activities: 90일 후 자동 삭제 (TTL)
+        ("user_activities", "timestamp",
+         {"expireAfterSeconds": 90 * 24 * 60 * 60, "name": "ttl_timestamp"}),
+        # user_activities: 필터 + timestamp 역순 정렬용 복합 인덱스
+        ("user_activities",
+         [("user_id", 1), ("activity_type", 1), ("paper_id", 1), ("timestamp", -1), ("_id", -1)],
+         {"name": ACTIVITIES_FILTER_INDEX}),
+        ("user_activities", [("user_id", 1), ("activity_type", 1), ("timestamp", -1), ("_id", -1)],
+         {"name": ACTIVITIES_USER_TYPE_INDEX}),
+        # bookmarks: 사용자별 최신순 조회/(bookmarked_at, _id) 커서 페이지네이션용
+        ("bookmarks", [("user_id", 1), ("bookmarked_at", -1), ("_id", -1)],
+         {"name": "user_bookmarked_at_id"}),
+        # 논문 검색용 text 인덱스 (제목 > 저자 > 초록 가중치)
+        (settings.mongo_collection, PAPERS_TEXT_INDEX_KEYS,
+         {"weights": PAPERS_TEXT_INDEX_WEIGHTS, "name": PAPERS_TEXT_INDEX}),
+        # 논문 카테고리 필터 + _id 역순 키셋 페이지네이션용 복합 인덱스
+        (settings.mongo_collection, [("categories", 1), ("_id", -1)],
+         {"name": "categories_id_desc"}),
+    ]
+    for coll_name, keys, options in index_specs:
+        try:
+            db[coll_name].create_index(keys, **options)
+            logger.info(f"Index ready: {coll_name}.{options['name']}")
+        except PyMongoError as e:
+            logger.warning(f"Index creation failed: {coll_name}.{options['name']}: {e}")
+    return True
+
+
 def close_mongo() -> None:
     """
     애플리케이션 종료 시 MongoDB 클라이언트 종료.
@@ -118,16 +196,46 @@ def get_mongo_client_direct() -> MongoClient:
     배치 작업 등 Dependency Injection을 사용할 수 없는 곳에서
     MongoDB 클라이언트에 직접 접근하기 위한 헬퍼 함수.
     
+    앱에서 이미 초기화한 전역 클라이언트(연결 풀)를 재사용하고,
+    CLI 등 lifespan 없이 실행된 경우에만 init_mongo()로 한 번 생성합니다.
+    
     Warning: 이 함수는 FastAPI 라우터가 아닌 곳에서만 사용하세요.
     라우터에서는 get_mongo_db() Dependency를 사용하세요.
     """
+    if _mongo_client is None:
+        init_mongo()
     if _mongo_client is None:
         raise RuntimeError(
-            "MongoDB is not initialized. Call init_mongo() first."
+            "MongoDB is not initialized. Check MONGO_HOST settings."
         )
     return _mongo_client
 
 
+def create_worker_mongo_client(max_pool_size: int = 2) -> MongoClient:
+    """
+    적재 워커 프로세스용 MongoClient를 새로 생성하여 반환.
+    앱 전역 클라이언트(minPoolSize=10)를 워커마다 만들면 유휴 연결이 워커 수만큼 늘어나므로
+    작은 풀의 전용 클라이언트를 사용.
+    
+    Args:
+        max_pool_size: 최대 연결 수 (워커는 bulk_write를 순차 전송하므로 작게 유지)
+    
+    Raises:
+        RuntimeError: MONGO_HOST가 설정되지 않은 경우
+    """
+    if not settings.mongo_host:
+        raise RuntimeError("MONGO_HOST is not set. Cannot create worker MongoDB client.")
+    return _create_client(
+        settings.mongo_host,
+        settings.mongo_port,
+        settings.mongo_user,
+        settings.mongo_password,
+        settings.mongo_auth_source,
+        serverSelectionTimeoutMS=5000,
+        maxPoolSize=max_pool_size,
+    )
+
+
 def get_prod_mongo_client() -> MongoClient:
     """
     Production MongoDB 클라이언트를 생성하여 반환.
@@ -151,14 +259,9 @@ def get_prod_mongo_client() -> MongoClient:
             "PROD_MONGO_HOST is not set. Cannot connect to production MongoDB."
         )
 
-    if user and password:
-        mongo_uri = f"mongodb://{user}:{password}@{host}:{port}/?authSource={auth_source}"
-    else:
-        mongo_uri = f"mongodb://{host}:{port}/"
-
     try:
-        client = MongoClient(
-            mongo_uri,
+        client = _create_client(
+            host, port, user, password, auth_source,
             serverSelectionTimeoutMS=10000,  # prod는 외부 네트워크이므로 타임아웃 길게
             maxPoolSize=10,  # 임시 연결이므로 작은 풀 사용
         )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import logging
-from urllib.parse import quote_plus
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from app.core.settings import settings
 
@@ -12,13 +12,16 @@ _SessionLocal = None
 
 logger = logging.getLogger(__name__)
 
-def _postgres_url() -> str:
-    host = settings.db_host
-    port = settings.db_port
-    user = quote_plus(settings.db_user or "")
-    password = quote_plus(settings.db_password or "")
-    db = settings.db_name
-    return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db}"
+def _postgres_url() -> URL:
+    # URL.create가 사용자/비밀번호의 특수문자(@, / 등)를 직접 처리하므로 수동 quote 불필요
+    return URL.create(
+        "postgresql+psycopg",
+        username=settings.db_user or None,
+        password=settings.db_password or None,
+        host=settings.db_host,
+        port=settings.db_port,
+        database=settings.db_name,
+    )
 
 def get_engine():
     global _engine
@@ -28,7 +31,17 @@ def get_engine():
             f"Initializing Postgres engine host={settings.db_host} port={settings.db_port} "
             f"user={settings.db_user} db={settings.db_name}"
         )
-        _engine = create_engine(url, pool_pre_ping=True, future=True)
+        _engine = create_engine(
+            url,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            # 체크아웃마다 SELECT 1(pre_ping) 대신 주기적으로 연결 교체
+            pool_pre_ping=False,
+            pool_recycle=settings.db_pool_recycle,
+            pool_timeout=10,  # 풀 고갈 시 30초 대기 대신 빠르게 실패
+            connect_args={"connect_timeout": 5, "application_name": "backend"},
+            future=True,
+        )
     return _engine
 
 def _get_sessionmaker():
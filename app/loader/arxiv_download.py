@@ -1,34 +1,20 @@
 from __future__ import annotations
-import json
 import logging
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Iterator
 import shutil
-import boto3
-from botocore.exceptions import BotoCoreError, NoCredentialsError, ClientError
 import requests
+from requests.adapters import HTTPAdapter
 
-from app.core.settings import settings
-from app.loader.config import DATA_DIR, DATA_FILE_PATH, MIN_FREE_GB, S3_BUCKET, S3_KEY, ARXIV_URL
+from app.loader.config import DATA_DIR, DATA_FILE_PATH, MIN_FREE_GB, HTTP_CHUNK_SIZE, ARXIV_URL
 from app.loader.utils import _fmt_bytes, _fmt_eta, get_current_time  # 추가
 
 logger = logging.getLogger(__name__)
 
-# 데이터 파일 경로
-BACKEND_ROOT = Path(__file__).resolve().parents[2]
-DEFAULT_DATA_DIR = BACKEND_ROOT / "data"
-DATA_DIR = Path(os.getenv("DATA_DIR", str(DEFAULT_DATA_DIR)))
-DATA_FILE_PATH = Path(os.getenv("ARXIV_FILE", str(DATA_DIR / "arxiv-metadata-oai-snapshot.json")))
-
-BATCH_SIZE = int(os.getenv("ARXIV_BATCH_SIZE", "1000"))
-PROGRESS_EVERY = int(os.getenv("ARXIV_PROGRESS_EVERY", "5000"))
-MIN_FREE_GB = int(os.getenv("ARXIV_MIN_FREE_GB", "5"))
-
-# S3 설정
-S3_BUCKET = os.getenv("S3_BUCKET", "inha-capstone-02-arxiv")
-S3_KEY = os.getenv("S3_KEY", "arxiv-metadata-oai-snapshot.json")
-ARXIV_URL = os.getenv("ARXIV_URL")
-
 def _has_enough_space(path: Path, need_gb: int) -> bool:
     total, used, free = shutil.disk_usage(path)
     free_gb = free // (1024**3)
@@ -37,6 +23,123 @@ def _has_enough_space(path: Path, need_gb: int) -> bool:
         return False
     return True
 
+# 병렬 구간 다운로드 설정 (구간 크기, 동시 요청 수)
+RANGE_CHUNK_SIZE = 16 * 1024 * 1024
+RANGE_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _log_progress(downloaded: int, total: int, start_t: float) -> None:
+    now = get_current_time()
+    pct = (downloaded / total) * 100.0
+    speed = downloaded / max(now - start_t, 1e-3)
+    eta = _fmt_eta(downloaded, total, now - start_t)
+    logger.info(f"[arxiv-job] url downloading {pct:.1f}% "
+                f"({_fmt_bytes(downloaded)}/{_fmt_bytes(total)}) "
+                f"at {_fmt_bytes(speed)}/s ETA {eta}")
+
+
+def _new_session() -> requests.Session:
+    """
+    다운로드용 HTTP 세션 (Range 확인/본문 다운로드가 같은 연결 풀과 TLS 세션을 재사용).
+    병렬 구간 다운로드 동시 연결 수만큼 풀 크기 확보.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=RANGE_CONCURRENCY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _probe_range_support(session: requests.Session, url: str) -> int | None:
+    """
+    Range 요청 지원 여부 확인.
+    presigned URL은 GET 서명이므로 HEAD 대신 첫 1바이트 GET으로 확인.
+    
+    Returns:
+        int | None: 지원 시 전체 파일 크기, 미지원/크기 불명 시 None
+    """
+    with session.get(url, headers={"Range": "bytes=0-0"}, stream=True, timeout=60) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            return None
+        # Content-Range: bytes 0-0/<total>
+        total = r.headers.get("Content-Range", "").rpartition("/")[2]
+        return int(total) if total.isdigit() else None
+
+
+def _download_range(session: requests.Session, url: str, fd: int, start: int, end: int) -> int:
+    """[start, end] 구간을 받아 파일의 같은 위치에 기록하고 받은 바이트 수 반환."""
+    offset = start
+    with session.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=60) as r:
+        r.raise_for_status()
+        for chunk in r.iter_content(chunk_size=HTTP_CHUNK_SIZE):
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+    if offset != end + 1:
+        raise IOError(f"incomplete range {start}-{end}: got {offset - start} bytes")
+    return offset - start
+
+
+def _download_ranges_parallel(
+    session: requests.Session, url: str, tmp_path: Path, total: int, start_t: float
+) -> None:
+    """파일을 RANGE_CHUNK_SIZE 구간으로 나눠 RANGE_CONCURRENCY개 연결로 동시에 다운로드."""
+    ranges = [
+        (start, min(start + RANGE_CHUNK_SIZE, total) - 1)
+        for start in range(0, total, RANGE_CHUNK_SIZE)
+    ]
+    downloaded = 0
+    next_pct = 5.0
+    with open(tmp_path, "wb") as f:
+        f.truncate(total)
+        with ThreadPoolExecutor(max_workers=RANGE_CONCURRENCY) as pool:
+            futures = [
+                pool.submit(_download_range, session, url, f.fileno(), start, end)
+                for start, end in ranges
+            ]
+            try:
+                for future in as_completed(futures):
+                    downloaded += future.result()
+                    pct = (downloaded / total) * 100.0
+                    if pct >= next_pct:
+                        _log_progress(downloaded, total, start_t)
+                        while pct >= next_pct:
+                            next_pct += 5.0
+            except BaseException:
+                # 한 구간이라도 실패하면 대기 중인 구간은 취소
+                for future in futures:
+                    future.cancel()
+                raise
+
+
+def _download_stream(session: requests.Session, url: str, tmp_path: Path, start_t: float) -> None:
+    """Range 미지원 서버용 단일 스트림 다운로드."""
+    with session.get(url, stream=True, timeout=60) as r:
+        r.raise_for_status()
+        total = int(r.headers.get("Content-Length") or 0)
+        last_log = start_t
+        downloaded = 0
+        next_pct = 5.0 if total else None
+        # 큰 청크 + 같은 크기의 쓰기 버퍼로 청크당 Python 오버헤드와 write 호출 수 감소
+        with open(tmp_path, "wb", buffering=HTTP_CHUNK_SIZE) as f:
+            for i, chunk in enumerate(r.iter_content(chunk_size=HTTP_CHUNK_SIZE)):
+                if not chunk:
+                    continue
+                f.write(chunk)
+                downloaded += len(chunk)
+                # 시간 확인은 16청크마다만
+                if not total or (i & 0xF):
+                    continue
+                now = get_current_time()
+                if (now - last_log) >= 2:
+                    pct = (downloaded / total) * 100.0
+                    if pct >= (next_pct or 1000):
+                        last_log = now
+                        _log_progress(downloaded, total, start_t)
+                        while next_pct is not None and pct >= next_pct:
+                            next_pct += 5.0
+
+
 def download_arxiv_from_presigned_url() -> bool:
     if not ARXIV_URL:
         logger.error("[arxiv-job] ARXIV_URL not set")
@@ -51,31 +154,16 @@ def download_arxiv_from_presigned_url() -> bool:
 
     tmp_path = DATA_FILE_PATH.with_suffix(".part")
     try:
-        with requests.get(ARXIV_URL, stream=True, timeout=60) as r:
-            r.raise_for_status()
-            total = int(r.headers.get("Content-Length") or 0)
-            start_t = get_current_time()
-            last_log = start_t
-            downloaded = 0
-            next_pct = 5.0 if total else None
-            with open(tmp_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=1024 * 1024):
-                    if not chunk:
-                        continue
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    now = get_current_time()
-                    if total and (now - last_log) >= 2:
-                        pct = (downloaded / total) * 100.0
-                        if pct >= (next_pct or 1000):
-                            last_log = now
-                            speed = downloaded / max(now - start_t, 1e-3)
-                            eta = _fmt_eta(downloaded, total, now - start_t)
-                            logger.info(f"[arxiv-job] url downloading {pct:.1f}% "
-                                        f"({_fmt_bytes(downloaded)}/{_fmt_bytes(total)}) "
-                                        f"at {_fmt_bytes(speed)}/s ETA {eta}")
-                            while next_pct is not None and pct >= next_pct:
-                                next_pct += 5.0
+        start_t = get_current_time()
+        with _new_session() as session:
+            total = _probe_range_support(session, ARXIV_URL)
+            if total:
+                # 구간(Range) GET을 병렬로 요청해 단일 연결 대역폭 한계를 넘김
+                logger.info(f"[arxiv-job] parallel range download size={_fmt_bytes(total)} "
+                            f"workers={RANGE_CONCURRENCY}")
+                _download_ranges_parallel(session, ARXIV_URL, tmp_path, total, start_t)
+            else:
+                _download_stream(session, ARXIV_URL, tmp_path, start_t)
         tmp_path.replace(DATA_FILE_PATH)
         took = get_current_time() - start_t
         logger.info(f"[arxiv-job] URL download complete in {took:.1f}s size={_fmt_bytes(DATA_FILE_PATH.stat().st_size)}")
@@ -89,6 +177,91 @@ def download_arxiv_from_presigned_url() -> bool:
             pass
         return False
 
+# 다운로드 스레드 → 파서 사이 청크 큐 크기 (HTTP_CHUNK_SIZE 단위)
+_STREAM_QUEUE_SIZE = 16
+_STREAM_DONE = object()
+
+
+def stream_arxiv_lines() -> Iterator[bytes]:
+    """
+    ARXIV_URL을 다운로드하면서 JSON Lines를 한 줄씩 내보냄.
+    
+    다운로드 스레드가 받은 청크를 파일(DATA_FILE_PATH)에 저장하는 동시에
+    제한된 크기의 큐로 전달하므로, 네트워크 수신과 파싱/적재가 겹쳐 진행됩니다.
+    끝까지 소비되면 .part 파일을 DATA_FILE_PATH로 확정합니다.
+    
+    Raises:
+        RuntimeError: ARXIV_URL 미설정 또는 디스크 공간 부족
+    """
+    if not ARXIV_URL:
+        raise RuntimeError("ARXIV_URL not set")
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    if not _has_enough_space(DATA_DIR, MIN_FREE_GB):
+        raise RuntimeError("not enough disk space for arXiv snapshot")
+
+    tmp_path = DATA_FILE_PATH.with_suffix(".part")
+    chunks: queue.Queue = queue.Queue(maxsize=_STREAM_QUEUE_SIZE)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        # 소비자가 중단하면 큐가 가득 찬 채로 멈추지 않도록 주기적으로 확인
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _download() -> None:
+        try:
+            with requests.get(ARXIV_URL, stream=True, timeout=60) as r, \
+                    open(tmp_path, "wb", buffering=HTTP_CHUNK_SIZE) as f:
+                r.raise_for_status()
+                for chunk in r.iter_content(chunk_size=HTTP_CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    if not _put(chunk):
+                        return
+            _put(_STREAM_DONE)
+        except BaseException as e:
+            _put(e)
+
+    start_t = get_current_time()
+    downloader = threading.Thread(target=_download, name="arxiv-download", daemon=True)
+    downloader.start()
+    completed = False
+    try:
+        leftover = b""
+        while True:
+            item = chunks.get()
+            if item is _STREAM_DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            lines = (leftover + item).split(b"\n")
+            leftover = lines.pop()
+            yield from lines
+        if leftover:
+            yield leftover
+        downloader.join()
+        tmp_path.replace(DATA_FILE_PATH)
+        completed = True
+        took = get_current_time() - start_t
+        logger.info(f"[arxiv-job] streamed download complete in {took:.1f}s "
+                    f"size={_fmt_bytes(DATA_FILE_PATH.stat().st_size)}")
+    finally:
+        stop.set()
+        if not completed:
+            downloader.join(timeout=5)
+            try:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            except Exception:
+                pass
+
+
 def ensure_arxiv_file() -> bool:
     if DATA_FILE_PATH.exists():
         return True
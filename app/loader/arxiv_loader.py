@@ -1,8 +1,9 @@
 from __future__ import annotations
 import logging  # <-- 반드시 추가!
-from app.loader.arxiv_download import ensure_arxiv_file
+from app.loader.arxiv_download import ensure_arxiv_file, stream_arxiv_lines
 from app.loader.arxiv_mongo import ingest_arxiv_to_mongo, copy_prod_to_local_mongo
 from app.core.settings import settings
+from app.loader.config import ARXIV_URL, DATA_FILE_PATH, STREAM_INGEST
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,10 @@ def load_arxiv_data_to_mongodb() -> bool:
         return copy_prod_to_local_mongo()
     else:
         logger.info("[arxiv-job] prod env: downloading and ingesting")
+        if STREAM_INGEST and ARXIV_URL and not DATA_FILE_PATH.exists():
+            # 다운로드와 파싱/적재를 겹쳐 실행
+            logger.info("[arxiv-job] streaming download into ingest")
+            return ingest_arxiv_to_mongo(stream_arxiv_lines())
         if not ensure_arxiv_file():
             logger.error("[arxiv-job] file preparation failed")
             return False
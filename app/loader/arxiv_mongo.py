@@ -1,103 +1,238 @@
 from __future__ import annotations
-import json
 import logging
+import multiprocessing as mp
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from pymongo import UpdateOne
-from pymongo.errors import BulkWriteError
+from typing import Iterable, Iterator
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo import IndexModel, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
 
-from app.db.mongodb import get_mongo_client_direct, get_prod_mongo_client
+from app.db.mongodb import (
+    create_worker_mongo_client,
+    get_mongo_client_direct,
+    get_prod_mongo_client,
+    PAPERS_TEXT_INDEX,
+    PAPERS_TEXT_INDEX_KEYS,
+    PAPERS_TEXT_INDEX_WEIGHTS,
+)
 from app.core.settings import settings
-from app.loader.arxiv_category import parse_categories
 from app.seed.categories_seed import seed_categories_from_codes
-from app.loader.config import DATA_FILE_PATH, BATCH_SIZE, PROGRESS_EVERY
+from app.loader.arxiv_parse import (
+    READ_BUFFER_SIZE,
+    fadvise,
+    parse_file_range,
+    parse_record,
+    split_file_ranges,
+)
+from app.loader.config import DATA_FILE_PATH, BATCH_SIZE, PROGRESS_EVERY, PARSE_WORKERS, WRITE_WORKERS
 from app.loader.utils import get_current_time
 
 logger = logging.getLogger(__name__)
 
-# 데이터 파일 경로
-BACKEND_ROOT = Path(__file__).resolve().parents[2]
-DEFAULT_DATA_DIR = BACKEND_ROOT / "data"
-DATA_DIR = Path(os.getenv("DATA_DIR", str(DEFAULT_DATA_DIR)))
-DATA_FILE_PATH = Path(os.getenv("ARXIV_FILE", str(DATA_DIR / "arxiv-metadata-oai-snapshot.json")))
+# 병렬 파싱 시 워커 하나가 맡는 파일 구간 크기
+PARSE_CHUNK_SIZE = 32 * 1024 * 1024
+# 전체 재적재 시 사용하는 임시 컬렉션 이름 접미사 (적재 완료 후 운영 컬렉션으로 교체)
+STAGING_SUFFIX = "_staging"
+# MongoDB 중복 키 오류 코드
+DUPLICATE_KEY_ERROR = 11000
 
-def read_and_parse_data(data_file_path: Path) -> list[UpdateOne]:
+def _iter_file_lines(data_file_path: Path) -> Iterator[bytes]:
+    # 바이너리 모드로 읽어 텍스트 디코딩 단계 생략 (orjson이 bytes를 직접 UTF-8 파싱)
+    with open(data_file_path, "rb", buffering=READ_BUFFER_SIZE) as f:
+        fadvise(f.fileno(), 0, 0, "POSIX_FADV_SEQUENTIAL")
+        yield from f
+        fadvise(f.fileno(), 0, 0, "POSIX_FADV_DONTNEED")
+
+def _make_op(_id: str, doc: dict, insert_only: bool) -> InsertOne | UpdateOne:
+    # 새로 만든 임시 컬렉션 적재는 기존 문서 조회가 필요 없는 InsertOne 사용
+    if insert_only:
+        return InsertOne(doc)
+    return UpdateOne({"id": _id}, {"$set": doc}, upsert=True)
+
+def iter_update_ops(lines: Iterable[bytes], insert_only: bool = False) -> Iterator[InsertOne | UpdateOne]:
     """
-    JSON 파일을 읽어 UpdateOne 배치 리스트를 생성.
+    JSON Lines를 한 줄씩 파싱해 쓰기 작업을 순차 생성 (전체 목록을 메모리에 만들지 않음).
+    
+    Args:
+        lines: JSON 한 줄씩의 bytes (파일 또는 다운로드 스트림)
+        insert_only: True면 upsert 대신 InsertOne 생성 (새 임시 컬렉션 적재용)
     """
-    ops: list[UpdateOne] = []
-    logger.info(f"[arxiv-job] read_and_parse_data: 시작, 파일={data_file_path}")
-    with open(data_file_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f):
-            if not line.strip():
-                continue
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            _id = data.get("id")
-            if not _id:
-                continue
-            codes = parse_categories(data.get("categories"))
-            doc = {
-                "id": _id,
-                "title": data.get("title"),
-                "authors": data.get("authors"),
-                "abstract": data.get("abstract"),
-                "categories": codes,
-                "update_date": data.get("update_date"),
-            }
-            doc = {k: v for k, v in doc.items() if v is not None}
-            ops.append(UpdateOne({"id": _id}, {"$set": doc}, upsert=True))
-            if (i + 1) % 10000 == 0:
-                logger.info(f"[arxiv-job] read_and_parse_data: {i + 1} lines parsed")
-    logger.info(f"[arxiv-job] read_and_parse_data: 완료, 총 {len(ops)} ops 생성")
-    return ops
-
-def batch_insert_documents(collection, failures_collection, ops: list[UpdateOne], batch_size: int, progress_every: int) -> int:
-    """
-    배치 리스트를 MongoDB에 삽입.
+    logger.info("[arxiv-job] iter_update_ops: 시작")
+    count = 0
+    # 줄마다 반복되는 전역 조회를 줄이기 위해 지역 변수로 바인딩
+    parse, make_op = parse_record, _make_op
+    for i, line in enumerate(lines):
+        record = parse(line)
+        if record is None:
+            continue
+        _id, doc = record
+        count += 1
+        yield make_op(_id, doc, insert_only)
+        if (i + 1) % 10000 == 0:
+            logger.info(f"[arxiv-job] iter_update_ops: {i + 1} lines parsed")
+    logger.info(f"[arxiv-job] iter_update_ops: 완료, 총 {count} ops 생성")
+
+# 프로세스 풀 워커별 MongoDB 컬렉션 (_init_ingest_worker에서 설정)
+_worker_collections: tuple | None = None
+
+def _init_ingest_worker(collection_name: str) -> None:
     """
+    프로세스 풀 워커 초기화: 워커 프로세스마다 작은 풀의 전용 MongoClient 생성.
+    MongoClient는 프로세스 간에 공유할 수 없으므로 부모의 클라이언트를 넘기지 않음.
+    
+    Args:
+        collection_name: 적재 대상 컬렉션 (전체 재적재 시 임시 컬렉션)
+    """
+    global _worker_collections
+    db = create_worker_mongo_client()[settings.mongo_db]
+    _worker_collections = (db[collection_name], db["arxiv_failures"])
+
+def _ingest_file_range(data_file_path: Path, start: int, end: int, insert_only: bool, batch_size: int) -> int:
+    """
+    [start, end) 구간을 파싱해 워커에서 바로 bulk_write (프로세스 풀 워커용).
+    파싱 결과를 부모 프로세스로 직렬화해 돌려보내지 않도록 워커가 직접 적재.
+    
+    Returns:
+        생성한 쓰기 작업 수
+    """
+    collection, failures_collection = _worker_collections
+    count = 0
+    # 구간 전체를 목록으로 만들지 않고 batch_size개마다 전송
+    batch: list[InsertOne | UpdateOne] = []
+    for _id, doc in parse_file_range(data_file_path, start, end):
+        batch.append(_make_op(_id, doc, insert_only))
+        if len(batch) >= batch_size:
+            _flush_batch(collection, failures_collection, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        _flush_batch(collection, failures_collection, batch)
+        count += len(batch)
+    return count
+
+def ingest_file_parallel(
+    data_file_path: Path, workers: int, collection_name: str, insert_only: bool = False
+) -> int:
+    """
+    파일을 바이트 구간으로 나눠 프로세스 풀에서 병렬로 파싱/적재 (GIL 우회).
+    각 워커가 자체 MongoClient로 collection_name에 bulk_write 하므로 부모 프로세스는 진행률만 집계.
+    
+    Returns:
+        처리한 전체 쓰기 작업 수
+    """
+    ranges = split_file_ranges(data_file_path, PARSE_CHUNK_SIZE)
+    logger.info(f"[arxiv-job] parallel ingest: {len(ranges)} ranges, workers={workers}")
     processed = 0
-    for i, op in enumerate(ops):
-        if (i + 1) % batch_size == 0:
+    next_progress = PROGRESS_EVERY
+    # 앱 프로세스(스레드 다수)를 fork하지 않도록 spawn 사용
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_ingest_worker,
+        initargs=(collection_name,),
+    ) as pool:
+        futures = [
+            pool.submit(_ingest_file_range, data_file_path, start, end, insert_only, BATCH_SIZE)
+            for start, end in ranges
+        ]
+        for future in as_completed(futures):
+            processed += future.result()
+            if processed >= next_progress:
+                logger.info(f"[arxiv-job] processed {processed} records")
+                next_progress = (processed // PROGRESS_EVERY + 1) * PROGRESS_EVERY
+    logger.info(f"[arxiv-job] parallel ingest: 완료, 총 {processed} ops 처리")
+    return processed
+
+def _flush_batch(collection, failures_collection, batch: list[InsertOne | UpdateOne]) -> None:
+    """
+    배치 하나를 bulk_write로 적재, 실패한 문서 id는 failures 컬렉션에 기록.
+    """
+    try:
+        # 컬렉션 validator가 없으므로 서버의 문서별 검증 단계 생략
+        collection.bulk_write(batch, ordered=False, bypass_document_validation=True)
+        logger.info(f"[arxiv-job] upserted {len(batch)} records")
+    except BulkWriteError as bwe:
+        write_errors = bwe.details.get("writeErrors", [])
+        # 중복 키 오류(스냅샷 내 중복 id)는 문서별로 남기지 않고 개수만 기록
+        duplicates = sum(1 for e in write_errors if e.get("code") == DUPLICATE_KEY_ERROR)
+        if duplicates:
+            logger.info(f"[arxiv-job] skipped {duplicates} duplicate ids in batch")
+        # 그 외 실패한 문서 id를 한 번의 insert_many로 기록
+        # (InsertOne은 op가 문서 자체, UpdateOne은 op["q"]가 조회 조건)
+        failed = [
+            {"id": op.get("id") or op.get("q", {}).get("id")}
+            for op in (
+                e.get("op") for e in write_errors if e.get("code") != DUPLICATE_KEY_ERROR
+            )
+            if op
+        ]
+        if failed:
+            logger.warning(f"[arxiv-job] {len(failed)} writes failed in batch")
+        if failed and failures_collection is not None:
             try:
-                collection.bulk_write(ops[i - batch_size + 1:i + 1], ordered=False)
-                logger.info(f"[arxiv-job] upserted {batch_size} records")
-            except BulkWriteError as bwe:
-                logger.warning(f"[arxiv-job] BulkWriteError: {bwe.details}")
-                for e in bwe.details.get("writeErrors", []):
-                    if failures_collection:
-                        failures_collection.insert_one({"id": e.get("op", {}).get("id")})
+                failures_collection.insert_many(failed, ordered=False)
             except Exception as e:
-                logger.error(f"[arxiv-job] unexpected bulk_write error: {e}")
-        if (i + 1) % progress_every == 0:
-            logger.info(f"[arxiv-job] processed {i + 1} records")
-        processed += 1
-    # 남은 배치 처리
-    if ops:
-        try:
-            collection.bulk_write(ops, ordered=False)
-            logger.info(f"[arxiv-job] upserted {len(ops)} records")
-        except BulkWriteError as bwe:
-            logger.warning(f"[arxiv-job] BulkWriteError: {bwe.details}")
-            for e in bwe.details.get("writeErrors", []):
-                if failures_collection:
-                    failures_collection.insert_one({"id": e.get("op", {}).get("id")})
-        except Exception as e:
-            logger.error(f"[arxiv-job] unexpected bulk_write error: {e}")
+                logger.error(f"[arxiv-job] failed to record {len(failed)} failures: {e}")
+    except Exception as e:
+        logger.error(f"[arxiv-job] unexpected bulk_write error: {e}")
+
+def batch_insert_documents(collection, failures_collection, ops: Iterable[InsertOne | UpdateOne], batch_size: int, progress_every: int) -> int:
+    """
+    쓰기 작업 스트림을 batch_size 단위로 모아 MongoDB에 적재.
+    파싱과 적재를 한 번의 순회로 처리해 전체 ops 목록을 메모리에 유지하지 않음.
+    bulk_write는 스레드 풀에서 최대 WRITE_WORKERS개까지 동시에 보내
+    이전 배치의 왕복 대기 중에도 다음 배치를 만들도록 함.
+    """
+    processed = 0
+    next_progress = progress_every
+    batch: list[InsertOne | UpdateOne] = []
+    append = batch.append
+    in_flight: deque = deque()
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS, thread_name_prefix="arxiv-write") as pool:
+        for op in ops:
+            append(op)
+            if len(batch) >= batch_size:
+                processed += len(batch)
+                if len(in_flight) >= WRITE_WORKERS * 2:
+                    # 대기 배치 수 제한 (가장 오래된 배치 완료 대기)
+                    # 워커 수만큼 배치를 더 대기시켜 전송이 끝난 스레드가 바로 다음 배치를 받도록 함
+                    in_flight.popleft().result()
+                in_flight.append(pool.submit(_flush_batch, collection, failures_collection, batch))
+                batch = []
+                append = batch.append
+                # 진행 로그는 작업마다가 아니라 배치 단위로 확인
+                if processed >= next_progress:
+                    logger.info(f"[arxiv-job] processed {processed} records")
+                    next_progress = (processed // progress_every + 1) * progress_every
+        # 남은 배치 처리
+        if batch:
+            processed += len(batch)
+            in_flight.append(pool.submit(_flush_batch, collection, failures_collection, batch))
+        for future in in_flight:
+            future.result()
     return processed
 
 def seed_categories_from_mongo(collection) -> None:
     """
     MongoDB의 카테고리 코드를 기반으로 PostgreSQL 시드.
     """
-    unique_codes = set()
-    cursor = collection.find({}, {"categories": 1})
-    for doc in cursor:
-        if "categories" in doc and isinstance(doc["categories"], list):
-            unique_codes.update(doc["categories"])
-    cursor.close()
+    # 전체 문서를 가져와 Python에서 모으지 않고 서버에서 고유 코드만 계산
+    try:
+        codes = collection.distinct("categories")
+    except OperationFailure:
+        # distinct 결과가 16MB 제한을 넘는 경우 aggregation으로 대체
+        codes = (
+            doc["_id"]
+            for doc in collection.aggregate(
+                [{"$unwind": "$categories"}, {"$group": {"_id": "$categories"}}],
+                allowDiskUse=True,
+            )
+        )
+    unique_codes = {c for c in codes if isinstance(c, str)}
     if unique_codes:
         logger.info(f"[arxiv-job] seeding PostgreSQL categories from {len(unique_codes)} codes")
         try:
@@ -105,9 +240,42 @@ def seed_categories_from_mongo(collection) -> None:
         except Exception as e:
             logger.error(f"[arxiv-job] category seeding failed: {e}")
 
-def ingest_arxiv_to_mongo() -> bool:
+def _create_search_indexes(collection) -> bool:
+    """
+    검색용 보조 인덱스 생성.
+    적재 중 문서마다 인덱스를 갱신하지 않도록 적재가 끝난 뒤 한 번에 생성.
+    
+    Returns:
+        bool: 생성 성공 여부 (이미 같은 인덱스가 있으면 성공)
+    """
+    try:
+        logger.info("[arxiv-job] 인덱스 생성 시작")
+        # title/abstract/authors는 텍스트 인덱스(또는 title_ngrams)로만 검색하므로
+        # 긴 문자열 전체를 키로 갖는 단일 필드 B-tree 인덱스는 만들지 않음
+        # (search_blob도 앞부분 고정이 없는 regex로만 조회해 인덱스 범위 탐색이 불가능하므로 제외)
+        collection.create_indexes([
+            IndexModel("categories"),
+            IndexModel([("categories", 1), ("update_date", -1)]),
+            IndexModel([("categories", 1), ("_id", -1)], name="categories_id_desc"),
+            IndexModel("title_ngrams"),
+            IndexModel(
+                PAPERS_TEXT_INDEX_KEYS,
+                weights=PAPERS_TEXT_INDEX_WEIGHTS,
+                name=PAPERS_TEXT_INDEX,
+            ),
+        ])
+        logger.info("[arxiv-job] 인덱스 생성 완료")
+        return True
+    except Exception as e:
+        logger.error(f"[arxiv-job] search index creation failed: {e}")
+        return False
+
+def ingest_arxiv_to_mongo(lines: Iterable[bytes] | None = None) -> bool:
     """
     arXiv 데이터를 MongoDB에 적재.
+    
+    Args:
+        lines: JSON Lines 스트림 (다운로드와 동시 적재 시 전달, 없으면 DATA_FILE_PATH 파일 사용)
     """
     try:
         client = get_mongo_client_direct()
@@ -116,40 +284,63 @@ def ingest_arxiv_to_mongo() -> bool:
         return False
 
     db = client[settings.mongo_db]
-    collection = db[settings.mongo_collection]
+    live_collection = db[settings.mongo_collection]
     failures_collection = db["arxiv_failures"]
-    logger.info(f"[arxiv-job] MongoDB collection: {collection.full_name}")
+    logger.info(f"[arxiv-job] MongoDB collection: {live_collection.full_name}")
 
+    # 전체 재적재와 최초 적재(운영 컬렉션이 빈 경우)는 임시 컬렉션에 적재한 뒤 rename으로 교체
+    # (적재 중에도 기존 컬렉션과 text 인덱스로 검색 API가 계속 동작)
     try:
-        logger.info("[arxiv-job] 인덱스 생성 시작")
-        # 기존 인덱스
+        replace = (
+            bool(os.getenv("ARXIV_REMOVE_OLD_DATA"))
+            or live_collection.estimated_document_count() == 0
+        )
+        if replace:
+            collection = db[settings.mongo_collection + STAGING_SUFFIX]
+            logger.info(f"[arxiv-job] full reload into staging collection: {collection.full_name}")
+            # 이전 실행이 남긴 임시 컬렉션 제거
+            collection.drop()
+        else:
+            collection = live_collection
+    except PyMongoError as e:
+        logger.error(f"[arxiv-job] failed to prepare target collection: {e}")
+        return False
+
+    try:
+        # upsert 조회용 고유 인덱스만 적재 전에 생성 (검색용 인덱스는 적재 후 생성)
         collection.create_index("id", unique=True)
-        # 검색 성능 향상용 인덱스 추가
-        collection.create_index("title")
-        collection.create_index("abstract")
-        collection.create_index("authors")
-        collection.create_index("categories")
-        collection.create_index([("categories", 1), ("update_date", -1)])
-        logger.info("[arxiv-job] 인덱스 생성 완료")
     except Exception as e:
-        logger.debug(f"Index create skipped (categories): {e}")
-
-    if os.getenv("ARXIV_REMOVE_OLD_DATA"):
-        logger.info("[arxiv-job] removing old data")
-        collection.delete_many({})
+        logger.debug(f"Index create skipped (id): {e}")
 
     try:
-        logger.info("[arxiv-job] 데이터 파싱 시작")
-        ops = read_and_parse_data(DATA_FILE_PATH)
-        logger.info("[arxiv-job] 데이터 파싱 완료, 적재 시작")
-        processed = batch_insert_documents(collection, failures_collection, ops, BATCH_SIZE, PROGRESS_EVERY)
+        logger.info("[arxiv-job] 데이터 파싱 및 적재 시작")
+        # 새로 만든 임시 컬렉션에만 upsert의 기존 문서 조회 단계를 생략하고 insert로 적재
+        # (운영 컬렉션 재실행에 InsertOne을 쓰면 기존 문서마다 중복 키 오류가 발생)
+        # 스냅샷 내 중복 id는 중복 키 오류 개수로만 기록됨
+        insert_only = replace
+        if insert_only:
+            logger.info("[arxiv-job] staging load with inserts")
+        if lines is None and PARSE_WORKERS > 1:
+            processed = ingest_file_parallel(DATA_FILE_PATH, PARSE_WORKERS, collection.name, insert_only)
+        else:
+            if lines is None:
+                lines = _iter_file_lines(DATA_FILE_PATH)
+            ops = iter_update_ops(lines, insert_only)
+            processed = batch_insert_documents(collection, failures_collection, ops, BATCH_SIZE, PROGRESS_EVERY)
         logger.info(f"[arxiv-job] data load complete total={processed}")
-        seed_categories_from_mongo(collection)
+        indexed = _create_search_indexes(collection)
+        if replace:
+            if not indexed:
+                # text 인덱스 없는 컬렉션으로 교체하면 검색이 실패하므로 기존 컬렉션 유지
+                logger.error("[arxiv-job] keeping the live collection: staging indexes are incomplete")
+                return False
+            # 인덱스까지 준비된 임시 컬렉션을 한 번에 운영 컬렉션으로 교체
+            collection.rename(settings.mongo_collection, dropTarget=True)
+            logger.info(f"[arxiv-job] swapped staging into {live_collection.full_name}")
+        seed_categories_from_mongo(live_collection)
         return True
     except FileNotFoundError:
         logger.error(f"[arxiv-job] file not found: {DATA_FILE_PATH}")
-    except json.JSONDecodeError as e:
-        logger.error(f"[arxiv-job] JSON decode error: {e}")
     except Exception as e:
         logger.error(f"[arxiv-job] unexpected error: {e}")
     return False
@@ -198,28 +389,45 @@ def copy_prod_to_local_mongo() -> bool:
 
         # 데이터 복제
         logger.info("[arxiv-job] Starting data copy...")
-        cursor = prod_coll.find({}, no_cursor_timeout=True)
-        batch = []
+        # RawBSONDocument: 받은 BSON을 dict로 디코딩하지 않고 그대로 insert_many에 전달
+        # _id는 prod 값을 그대로 유지해 로컬에서도 같은 논문 ID(북마크/활동 참조)를 사용
+        raw_prod_coll = prod_coll.with_options(
+            codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
         BATCH_SIZE = 1000
+        cursor = raw_prod_coll.find(
+            {}, no_cursor_timeout=True, batch_size=BATCH_SIZE
+        )
+        batch = []
         count = 0
+        in_flight: deque = deque()
+
+        def insert_batch(docs: list) -> None:
+            # 복제는 문서 순서가 필요 없으므로 unordered로 전송, validator 검증 생략
+            local_coll.insert_many(docs, ordered=False, bypass_document_validation=True)
 
         try:
-            for doc in cursor:
-                # _id는 MongoDB가 자동 생성하도록 제거
-                doc.pop("_id", None)
-                batch.append(doc)
+            # 읽기(prod)와 쓰기(local)를 겹치도록 insert_many를 스레드 풀에서 동시 전송
+            with ThreadPoolExecutor(max_workers=WRITE_WORKERS, thread_name_prefix="arxiv-copy") as pool:
+                for doc in cursor:
+                    batch.append(doc)
+                    
+                    if len(batch) >= BATCH_SIZE:
+                        if len(in_flight) >= WRITE_WORKERS * 2:
+                            in_flight.popleft().result()
+                        # 전송 중인 목록을 재사용하지 않도록 새 목록으로 교체
+                        in_flight.append(pool.submit(insert_batch, batch))
+                        count += len(batch)
+                        logger.info(f"[arxiv-job] Copied {count} documents so far...")
+                        batch = []
                 
-                if len(batch) >= BATCH_SIZE:
-                    local_coll.insert_many(batch)
+                # 남은 배치 처리
+                if batch:
+                    in_flight.append(pool.submit(insert_batch, batch))
                     count += len(batch)
-                    logger.info(f"[arxiv-job] Copied {count} documents so far...")
-                    batch.clear()
-            
-            # 남은 배치 처리
-            if batch:
-                local_coll.insert_many(batch)
-                count += len(batch)
-                logger.info(f"[arxiv-job] Copied final batch. Total: {count} documents")
+                    logger.info(f"[arxiv-job] Copied final batch. Total: {count} documents")
+                for future in in_flight:
+                    future.result()
         finally:
             cursor.close()
 
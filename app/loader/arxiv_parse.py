@@ -0,0 +1,136 @@
+"""
+arXiv JSON Lines 레코드 파싱.
+
+프로세스 풀 워커에서도 가볍게 import 되도록 DB/설정 모듈에 의존하지 않습니다.
+"""
+from __future__ import annotations
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+import msgspec
+
+from app.loader.arxiv_category import parse_categories
+from app.utils.ngram import make_ngrams
+
+# JSON Lines 파일 읽기 버퍼 크기
+READ_BUFFER_SIZE = 1 << 20
+
+
+class ArxivRecord(msgspec.Struct):
+    """
+    arXiv 스냅샷 한 줄 중 저장에 사용하는 필드.
+    선언하지 않은 키(versions, authors_parsed 등)는 객체를 만들지 않고 건너뜀.
+    """
+    id: str | None = None
+    title: str | None = None
+    authors: str | None = None
+    abstract: str | None = None
+    categories: str | None = None
+    update_date: str | None = None
+
+
+# 스키마가 고정된 디코더를 한 번만 생성해 재사용
+_decode_record = msgspec.json.Decoder(ArxivRecord).decode
+
+
+@lru_cache(maxsize=65536)
+def _parse_categories_cached(raw: str | None) -> tuple[str, ...]:
+    """
+    카테고리 문자열 파싱 결과 캐시.
+    카테고리 조합 종류가 적어 대부분의 줄이 캐시 조회로 끝남.
+    여러 문서가 결과를 공유하므로 변경할 수 없는 tuple로 보관.
+    """
+    return tuple(parse_categories(raw))
+
+
+def fadvise(fd: int, offset: int, length: int, advice_name: str) -> None:
+    """
+    파일 접근 패턴을 커널에 알림 (Linux 전용, 지원하지 않는 플랫폼에서는 무시).
+    
+    Args:
+        advice_name: "POSIX_FADV_SEQUENTIAL"(readahead 확대), "POSIX_FADV_DONTNEED"(읽은 페이지 캐시 해제) 등
+    """
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, offset, length, advice)
+    except OSError:
+        pass
+
+
+def build_search_blob(doc: dict) -> str:
+    """
+    title/abstract/authors를 하나의 소문자 문자열로 결합.
+    검색 regex 대체 경로에서 세 필드를 $or로 검사하지 않도록 사용.
+    """
+    return " ".join(
+        doc[k] for k in ("title", "abstract", "authors") if isinstance(doc.get(k), str)
+    ).lower()
+
+
+def parse_record(line: bytes) -> tuple[str, dict] | None:
+    """
+    JSON 한 줄을 (arXiv id, 저장할 문서)로 변환. 빈 줄/깨진 줄/id 없는 줄은 None.
+    """
+    try:
+        # 빈 줄/깨진 줄/타입이 다른 줄은 디코딩 오류로 건너뜀
+        rec = _decode_record(line)
+    except msgspec.MsgspecError:
+        return None
+    _id = rec.id
+    if not _id:
+        return None
+    # 값이 있는 필드만 바로 담아 None 필터링용 dict를 따로 만들지 않음
+    doc = {"id": _id}
+    if rec.title is not None:
+        doc["title"] = rec.title
+    if rec.authors is not None:
+        doc["authors"] = rec.authors
+    if rec.abstract is not None:
+        doc["abstract"] = rec.abstract
+    if rec.update_date is not None:
+        doc["update_date"] = rec.update_date
+    doc["categories"] = list(_parse_categories_cached(rec.categories))
+    # regex 대체 검색용 결합 필드 (소문자, 필드 하나만 검사하도록)
+    doc["search_blob"] = build_search_blob(doc)
+    # 부분 문자열 검색용 제목 n-gram
+    doc["title_ngrams"] = make_ngrams(doc.get("title"))
+    return _id, doc
+
+
+def split_file_ranges(path: Path, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    파일을 chunk_size 바이트 단위 [start, end) 구간으로 분할.
+    줄 경계는 parse_file_range에서 맞춤.
+    """
+    size = os.path.getsize(path)
+    return [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+
+def parse_file_range(path: Path, start: int, end: int) -> Iterator[tuple[str, dict]]:
+    """
+    [start, end) 구간에서 "시작하는" 줄만 파싱해 순차 생성 (프로세스 풀 워커용).
+
+    구간 중간에서 시작하면 앞 구간이 처리할 잘린 줄을 건너뛰고,
+    end를 걸치는 마지막 줄은 끝까지 읽어 이 구간에서 처리합니다.
+    """
+    with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
+        fadvise(f.fileno(), start, end - start, "POSIX_FADV_SEQUENTIAL")
+        if start > 0:
+            # 직전 바이트부터 줄 끝까지 버리면 start 이후 첫 줄의 시작 위치가 됨
+            f.seek(start - 1)
+            pos = start - 1 + len(f.readline())
+        else:
+            pos = 0
+        for line in f:
+            if pos >= end:
+                break
+            pos += len(line)
+            record = parse_record(line)
+            if record is not None:
+                yield record
+        # 다시 읽지 않는 구간이므로 페이지 캐시에서 내려 다른 프로세스의 캐시를 밀어내지 않도록 함
+        fadvise(f.fileno(), start, end - start, "POSIX_FADV_DONTNEED")
@@ -8,9 +8,19 @@ DATA_DIR = Path(os.getenv("DATA_DIR", str(DEFAULT_DATA_DIR)))
 DATA_FILE_PATH = Path(os.getenv("ARXIV_FILE", str(DATA_DIR / "arxiv-metadata-oai-snapshot.json")))
 
 # 배치 및 진행률 설정
-BATCH_SIZE = int(os.getenv("ARXIV_BATCH_SIZE", "1000"))
+# bulk_write 한 번에 보내는 작업 수 (ARXIV_BATCH_SIZE로 변경 가능)
+# 16MB/48MB 메시지 제한을 넘는 배치는 pymongo가 자동으로 나눠 전송
+BATCH_SIZE = int(os.getenv("ARXIV_BATCH_SIZE", "5000"))
 PROGRESS_EVERY = int(os.getenv("ARXIV_PROGRESS_EVERY", "5000"))
 MIN_FREE_GB = int(os.getenv("ARXIV_MIN_FREE_GB", "5"))
+# 다운로드 시 HTTP 응답을 읽는 단위 (bytes)
+HTTP_CHUNK_SIZE = int(os.getenv("ARXIV_HTTP_CHUNK", str(8 * 1024 * 1024)))
+# JSON 파싱 프로세스 수 (1이면 단일 프로세스)
+PARSE_WORKERS = int(os.getenv("ARXIV_PARSE_WORKERS", str(os.cpu_count() or 1)))
+# 동시에 전송하는 bulk_write 배치 수
+WRITE_WORKERS = max(1, int(os.getenv("ARXIV_WRITE_WORKERS", "4")))
+# 파일이 없을 때 다운로드와 동시에 파싱/적재 (다운로드 완료를 기다리지 않음)
+STREAM_INGEST = os.getenv("ARXIV_STREAM_INGEST", "").lower() in ("1", "true", "yes")
 
 # S3 설정
 S3_BUCKET = os.getenv("S3_BUCKET", "inha-capstone-02-arxiv")
@@ -1,17 +1,21 @@
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
+import threading
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.base import ConflictingIdError
+import anyio.to_thread
 import os
 
 # 3. 앱 시작 시 로깅 설정 적용
 from app.core.logging_config import setup_logging  # 추가
 setup_logging()  # 가장 먼저 호출
 
-# Settings를 초기화하여 .env 계층을 로드
+# settings는 지연 프록시: 첫 속성 접근 시 .env 계층을 로드
 from app.core.settings import settings
 from app.core.exceptions import (
     AppException,
@@ -40,12 +44,16 @@ logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
 JOB_ID = "arxiv_loader_daily_4am"
+# arXiv 적재 전용 스레드
+# (수 시간 걸리는 동기 작업이 이벤트 루프 기본 executor를 점유하지 않도록 분리)
+_ARXIV_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arxiv-job")
 
 
-def _run_scheduled_arxiv_job():
+async def _run_scheduled_arxiv_job():
     log = logging.getLogger("uvicorn.error")
     log.info("[arxiv-job][scheduled] triggered")
-    ok = load_arxiv_data_to_mongodb()
+    loop = asyncio.get_running_loop()
+    ok = await loop.run_in_executor(_ARXIV_EXECUTOR, load_arxiv_data_to_mongodb)
     if ok:
         log.info("[arxiv-job][scheduled] success")
     else:
@@ -76,16 +84,37 @@ def _ensure_daily_job():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    # 동기 라우트(PyMongo/SQLAlchemy)는 스레드풀에서 실행되므로
+    # 기본 40개 제한 대신 DB 연결 풀 크기만큼 동시 처리 허용
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+
     try:
         # PostgreSQL 테이블 준비
         init_db()
     except Exception as e:
         logger.error(f"init_db failed: {e}")
 
-    # MongoDB 연결 초기화
+    # 카테고리 코드 인덱스 미리 적재 (실패 시 첫 요청에서 적재)
     try:
-        from app.db.mongodb import init_mongo
+        from app.utils.category_index import get_category_index
+        db = next(get_db())
+        try:
+            get_category_index(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"category index warm-up failed: {e}")
+
+    # MongoDB 연결 초기화 (연결 확인/인덱스 생성은 시작을 막지 않도록 백그라운드 실행)
+    mongo_setup_thread = None
+    try:
+        from app.db.mongodb import init_mongo, ensure_mongo_indexes
         init_mongo()
+        # 대용량 컬렉션의 인덱스 생성이 종료(배포/SIGTERM)를 막지 않도록 daemon 스레드에서 실행
+        mongo_setup_thread = threading.Thread(
+            target=ensure_mongo_indexes, name="mongo-index-setup", daemon=True
+        )
+        mongo_setup_thread.start()
     except Exception as e:
         logger.error(f"init_mongo failed: {e}")
 
@@ -98,8 +127,11 @@ async def lifespan(app: FastAPI):
     # Shutdown
     if scheduler.running:
         scheduler.shutdown(wait=False)
+    _ARXIV_EXECUTOR.shutdown(wait=False)
     
-    # MongoDB 연결 종료
+    # MongoDB 연결 종료 (진행 중인 인덱스 생성은 기다리지 않음, 서버 측 생성은 계속 진행됨)
+    if mongo_setup_thread is not None and mongo_setup_thread.is_alive():
+        logger.warning("MongoDB index setup still running; shutting down without waiting")
     try:
         from app.db.mongodb import close_mongo
         close_mongo()
@@ -107,7 +139,7 @@ async def lifespan(app: FastAPI):
         logger.error(f"close_mongo failed: {e}")
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 # Exception handlers
@@ -115,7 +147,7 @@ app = FastAPI(lifespan=lifespan)
 async def database_exception_handler(request: Request, exc: DatabaseException):
     """데이터베이스 관련 예외 처리"""
     logger.error(f"Database error at {request.url.path}: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Database operation failed",
@@ -129,7 +161,7 @@ async def database_exception_handler(request: Request, exc: DatabaseException):
 async def resource_not_found_handler(request: Request, exc: ResourceNotFoundException):
     """리소스를 찾을 수 없음 예외 처리"""
     logger.warning(f"Resource not found at {request.url.path}: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "detail": str(exc),
@@ -143,7 +175,7 @@ async def resource_not_found_handler(request: Request, exc: ResourceNotFoundExce
 async def validation_exception_handler(request: Request, exc: ValidationException):
     """입력값 검증 실패 예외 처리"""
     logger.warning(f"Validation error at {request.url.path}: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={
             "detail": str(exc),
@@ -157,7 +189,7 @@ async def validation_exception_handler(request: Request, exc: ValidationExceptio
 async def business_logic_exception_handler(request: Request, exc: BusinessLogicException):
     """비즈니스 로직 예외 처리"""
     logger.warning(f"Business logic error at {request.url.path}: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={
             "detail": str(exc),
@@ -171,7 +203,7 @@ async def business_logic_exception_handler(request: Request, exc: BusinessLogicE
 async def app_exception_handler(request: Request, exc: AppException):
     """일반 애플리케이션 예외 처리"""
     logger.warning(f"Application error at {request.url.path}: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={
             "detail": str(exc),
@@ -5,6 +5,8 @@ from app.db.postgres import Base
 
 class User(Base):
     __tablename__ = "users"
+    # INSERT ... RETURNING으로 서버 기본값(created_at 등)을 함께 받아옴
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
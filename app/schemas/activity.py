@@ -39,5 +39,6 @@ class UserActivityOut(BaseModel):
 
 class UserActivityListResponse(BaseModel):
     """활동 로그 목록 응답"""
-    total: int
+    total: Optional[int] = None  # include_total=true일 때만 채워짐
     items: List[UserActivityOut]
+    next_cursor: Optional[str] = None  # 다음 페이지 조회 시 cursor로 전달 ("시각_id" 복합 커서)
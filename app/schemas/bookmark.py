@@ -41,3 +41,5 @@ class BookmarkListOut(BaseModel):
     북마크 목록 응답 모델.
     """
     items: List[BookmarkOut]
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None  # 다음 페이지 조회 시 cursor로 전달 ("시각_id" 복합 커서)
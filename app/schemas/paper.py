@@ -37,6 +37,7 @@ class PaperSearchResponse(BaseModel):
     total_pages: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None  # 키셋 페이지네이션용 (after로 전달)
     items: List[Paper]
 
 
@@ -59,3 +60,4 @@ class SearchHistoryResponse(BaseModel):
     """검색 기록 조회 응답"""
     total: int
     items: List[SearchHistoryItem]
+    next_cursor: Optional[str] = None  # 다음 페이지 조회 시 cursor로 전달 ("시각_id" 복합 커서)
@@ -368,6 +368,10 @@ def seed_categories_from_codes(codes: list[str]) -> None:
     finally:
         db.close()
 
+    # 새 카테고리가 생겼을 수 있으므로 코드 인덱스 캐시 갱신
+    from app.utils.category_index import invalidate_category_index
+    invalidate_category_index()
+
 
 def _create_category_from_seed(db: Session, item: Dict, existing_by_code: Dict[str, Category]):
     code = item["code"]
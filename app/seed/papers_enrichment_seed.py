@@ -180,10 +180,9 @@ def enrich_papers_standalone() -> None:
     """
     독립 실행용 래퍼 함수.
     """
-    from app.db.mongodb import init_mongo, get_mongo_client_direct
+    from app.db.mongodb import get_mongo_client_direct
     from app.core.settings import settings
     
-    init_mongo()
     client = get_mongo_client_direct()
     db = client[settings.mongo_db]
     
@@ -0,0 +1,75 @@
+"""
+카테고리 코드 인덱스 캐시.
+
+categories 테이블은 거의 변하지 않는 참조 데이터이므로
+code → (id, 한국어 이름, 영어 이름) 매핑을 프로세스 메모리에 한 번만 적재합니다.
+카테고리 시드/적재 후에는 invalidate_category_index()로 갱신합니다.
+"""
+from __future__ import annotations
+import logging
+import threading
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.category import Category, CategoryName
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryEntry(NamedTuple):
+    """카테고리 인덱스 항목"""
+    id: int
+    name_ko: Optional[str]
+    name_en: Optional[str]
+
+
+_index: Mapping[str, CategoryEntry] | None = None
+_lock = threading.Lock()
+
+
+def _load_index(db: Session) -> Mapping[str, CategoryEntry]:
+    names: dict[int, dict[str, str]] = {}
+    for category_id, locale, name in db.query(
+        CategoryName.category_id, CategoryName.locale, CategoryName.name
+    ):
+        names.setdefault(category_id, {})[locale] = name
+
+    index = {
+        code: CategoryEntry(
+            id=category_id,
+            name_ko=names.get(category_id, {}).get("ko"),
+            name_en=names.get(category_id, {}).get("en"),
+        )
+        for category_id, code in db.query(Category.id, Category.code)
+    }
+    logger.info(f"Category index loaded: {len(index)} categories")
+    return MappingProxyType(index)
+
+
+def get_category_index(db: Session) -> Mapping[str, CategoryEntry]:
+    """
+    code → CategoryEntry 읽기 전용 매핑 반환 (최초 호출 시 DB에서 적재).
+    
+    Args:
+        db: SQLAlchemy Session (캐시가 비어 있을 때만 사용)
+    
+    Returns:
+        Mapping[str, CategoryEntry]: 카테고리 코드 인덱스
+    """
+    global _index
+    index = _index
+    if index is not None:
+        return index
+    with _lock:
+        if _index is None:
+            _index = _load_index(db)
+        return _index
+
+
+def invalidate_category_index() -> None:
+    """카테고리 데이터 변경 후 캐시 무효화 (다음 조회 시 재적재)"""
+    global _index
+    with _lock:
+        _index = None
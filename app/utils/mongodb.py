@@ -4,11 +4,17 @@ MongoDB 관련 유틸리티 함수.
 ObjectId 변환, 문서 직렬화 등 MongoDB 작업에 필요한 공통 함수를 제공합니다.
 """
 
+import re
+import orjson
+from datetime import datetime
 from bson import ObjectId
-from bson.errors import InvalidId
 from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import Any, Dict
 
+# 24자리 16진수 ObjectId 형식
+_HEX24 = re.compile(r"[0-9a-fA-F]{24}")
+
 
 def safe_object_id(id_str: str, field_name: str = "ID") -> ObjectId:
     """
@@ -30,13 +36,53 @@ def safe_object_id(id_str: str, field_name: str = "ID") -> ObjectId:
         >>> oid = safe_object_id("507f1f77bcf86cd799439011", "paper ID")
         >>> oid = safe_object_id(paper_id, "bookmark ID")
     """
-    try:
-        return ObjectId(id_str)
-    except (InvalidId, Exception):
+    # 형식 검사를 먼저 해서 잘못된 입력은 ObjectId 생성/예외 처리 없이 거절
+    if not isinstance(id_str, str) or not _HEX24.fullmatch(id_str):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid {field_name} format"
         )
+    return ObjectId(id_str)
+
+
+def encode_cursor(timestamp: datetime, id_str: str) -> str:
+    """
+    (시각, _id) 복합 커서를 "ISO 시각_ObjectId" 문자열로 변환.
+    
+    Example:
+        >>> encode_cursor(doc["timestamp"], doc["id"])
+        "2025-01-01T12:00:00.123000_507f1f77bcf86cd799439011"
+    """
+    return f"{timestamp.isoformat()}_{id_str}"
+
+
+def cursor_filter(cursor: str, time_field: str) -> Dict[str, Any]:
+    """
+    encode_cursor로 만든 커서보다 뒤(더 오래된) 문서만 조회하는 조건 생성.
+    
+    같은 시각의 문서가 여러 개여도 _id로 순서를 정해 페이지 경계에서 누락되지 않도록 함.
+    {time_field: -1, "_id": -1} 정렬과 함께 사용해야 합니다.
+    
+    Args:
+        cursor: 이전 응답의 next_cursor
+        time_field: 정렬 기준 시각 필드 이름
+    
+    Raises:
+        HTTPException: 커서 형식이 잘못된 경우 (HTTP 400)
+    """
+    ts_str, _, id_str = cursor.rpartition("_")
+    try:
+        ts = datetime.fromisoformat(ts_str)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor format"
+        )
+    oid = safe_object_id(id_str, "cursor")
+    return {"$or": [
+        {time_field: {"$lt": ts}},
+        {time_field: ts, "_id": {"$lt": oid}},
+    ]}
 
 
 def serialize_object_id(doc: Dict[str, Any], *fields: str) -> Dict[str, Any]:
@@ -99,3 +145,30 @@ def serialize_doc_for_api(doc: Dict[str, Any]) -> Dict[str, Any]:
             doc[field] = str(doc[field])
     
     return doc
+
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson이 기본 지원하지 않는 BSON 타입 변환 (ObjectId → 문자열)"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class MongoJSONResponse(ORJSONResponse):
+    """
+    MongoDB 문서를 그대로 담아 응답하는 orjson 응답 클래스.
+    
+    ObjectId 필드를 문서마다 Python에서 변환하지 않고
+    orjson 직렬화 단계에서 한 번에 문자열로 변환합니다.
+    
+    Example:
+        >>> docs = list(coll.find(query, {"_id": 1, "title": 1}))
+        >>> return MongoJSONResponse({"items": docs})
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
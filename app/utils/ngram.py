@@ -0,0 +1,32 @@
+"""
+부분 문자열 검색용 n-gram 유틸리티.
+
+$text 인덱스는 단어 단위 매칭만 지원하므로, 논문 제목의 n-gram을 미리 저장해 두고
+검색어의 n-gram이 모두 포함된 문서를 인덱스로 찾는 데 사용합니다.
+"""
+from __future__ import annotations
+
+NGRAM_SIZE = 3
+
+
+def make_ngrams(text: str | None, n: int = NGRAM_SIZE) -> list[str]:
+    """
+    문자열을 소문자 n-gram 목록으로 변환 (중복 제거, 등장 순서 유지).
+    
+    Args:
+        text: 원본 문자열
+        n: n-gram 길이 (기본 3)
+    
+    Returns:
+        list[str]: n-gram 목록 (n보다 짧은 문자열이면 빈 리스트)
+    
+    Example:
+        >>> make_ngrams("BERT model")
+        ["ber", "ert", "rt ", "t m", " mo", "mod", "ode", "del"]
+    """
+    if not text:
+        return []
+    normalized = " ".join(text.lower().split())
+    return list(dict.fromkeys(
+        normalized[i:i + n] for i in range(len(normalized) - n + 1)
+    ))
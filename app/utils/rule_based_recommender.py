@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 
 from app.utils.rule_based_scorer import RuleBasedScorer
 from app.core.settings import settings
+from app.db.mongodb import PAPERS_EXCLUDE_SEARCH_FIELDS
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -189,6 +190,7 @@ class RuleBasedRecommender:
         if user_interests:
             interest_papers = list(collection.find(
                 {"categories": {"$in": user_interests}},
+                PAPERS_EXCLUDE_SEARCH_FIELDS,
                 limit=int(limit * 0.7)
             ))
             candidates.extend(interest_papers)
@@ -196,6 +198,7 @@ class RuleBasedRecommender:
         # 2. 인기 논문 (limit의 30%)
         popular_papers = list(collection.find(
             {},
+            PAPERS_EXCLUDE_SEARCH_FIELDS,
             sort=[("view_count", -1), ("bookmark_count", -1)],
             limit=int(limit * 0.3)
         ))